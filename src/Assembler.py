@@ -94,6 +94,22 @@ class RiscVAssembler:
             print(f"❌ Error reading file: {e}")
             return []
     
+    def assemble_source(self, source: str) -> List[int]:
+        """
+        Κάνει assemble κώδικα από string, χωρίς αρχείο στο δίσκο
+        
+        Args:
+            source (str): Assembly κώδικας
+            
+        Returns:
+            List[int]: Λίστα με 16-bit εντολές
+        """
+        lines = source.splitlines(keepends=True)  # Ίδιες γραμμές με το readlines()
+        
+        print(f"📝 Assembling source: {len(lines)} lines")
+        
+        return self._assemble_lines(lines)
+    
     def _assemble_lines(self, lines: List[str]) -> List[int]:
         """
         Κύρια διαδικασία assembling
@@ -10,6 +10,9 @@ class InstructionDecoder:
     Υποστηρίζει όλους τους τύπους εντολών: R, I, S, B, J, Special
     """
     
+    # Μέγιστο πλήθος decoded εντολών στο cache (ένα entry ανά 16-bit word)
+    DECODE_CACHE_SIZE = 4096
+    
     def __init__(self):
         """Αρχικοποίηση InstructionDecoder"""
         
@@ -50,6 +53,9 @@ class InstructionDecoder:
         # Statistics
         self.decode_count = 0
         self.decode_history = []
+        
+        # Decode cache: instruction word → decoded dict (το decoding είναι pure)
+        self._decode_cache = {}
     
     def decode(self, instruction: int) -> Dict[str, Any]:
         """
@@ -66,6 +72,28 @@ class InstructionDecoder:
         # Ensure 16-bit
         instruction = instruction & 0xFFFF
         
+        # Ίδιο word → ίδιο αποτέλεσμα: επανάχρηση χωρίς νέο decoding
+        decoded = self._decode_cache.get(instruction)
+        if decoded is None:
+            decoded = self._decode_uncached(instruction)
+            if len(self._decode_cache) < self.DECODE_CACHE_SIZE:
+                self._decode_cache[instruction] = decoded
+        
+        # Add to history
+        self.decode_history.append(decoded)
+        
+        return decoded
+    
+    def _decode_uncached(self, instruction: int) -> Dict[str, Any]:
+        """
+        Αποκωδικοποίηση χωρίς cache (pure: χωρίς αλλαγή state)
+        
+        Args:
+            instruction (int): 16-bit binary instruction
+            
+        Returns:
+            Dict: Structured instruction data
+        """
         # Extract opcode (bits 15-12)
         opcode = (instruction >> 12) & 0xF
         
@@ -92,9 +120,6 @@ class InstructionDecoder:
         else:
             decoded = self._create_invalid_instruction(instruction, opcode)
         
-        # Add to history
-        self.decode_history.append(decoded)
-        
         return decoded
     
     def _decode_r_type(self, instruction: int, opcode: int, inst_info: Dict) -> Dict[str, Any]:
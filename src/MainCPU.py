@@ -1,4 +1,5 @@
 from typing import Dict, Any, Optional, List
+from array import array
 import os
 import sys
 
@@ -24,6 +25,16 @@ class RiscVProcessor:
     - Program Counter & execution control
     """
     
+    # Instruction type → statistics counter
+    TYPE_STAT_KEYS = {
+        "R": "r_type_count",
+        "I": "i_type_count",
+        "S": "s_type_count",
+        "B": "b_type_count",
+        "J": "j_type_count",
+        "Special": "special_count"
+    }
+    
     def __init__(self, instruction_memory_size=1024, data_memory_size=1024):
         """Initialize the complete processor"""
         
@@ -46,6 +57,13 @@ class RiscVProcessor:
         # Execution history for debugging
         self.execution_history = []
         
+        # Pre-decoded program (see compile_program)
+        self._compiled_program = None
+        self._compiled_memory = None
+        
+        # Opcode → execute method jump table (one slot per 4-bit opcode)
+        self._dispatch = self._build_dispatch_table()
+        
         # Statistics
         self.stats = {
             "r_type_count": 0,
@@ -107,9 +125,28 @@ class RiscVProcessor:
         return self.instruction_memory.load_from_binary_file(filename)
     
     def load_program_direct(self, instructions: List[int]) -> bool:
-        """Load program directly from list of instructions"""
+        """Load program directly from list (or array('H')) of instructions"""
         return self.instruction_memory.load_program(instructions)
     
+    def reload_program(self, instructions: List[int]) -> bool:
+        """
+        Reset processor and load a program (reset() + load_program_direct())
+        
+        If the same program is already in instruction memory it is kept
+        as-is: no new buffer, and a pre-decoded program stays valid.
+        """
+        self.reset()
+        
+        if not isinstance(instructions, array) or instructions.typecode != 'H':
+            instructions = array('H', [instruction & 0xFFFF for instruction in instructions])
+        
+        imem = self.instruction_memory
+        size = len(instructions)
+        if imem.program_size == size and imem.memory[:size] == instructions:
+            print(f"✅ Program already loaded: {size} instructions")
+            return True
+        return imem.load_program(instructions)
+    
     def step(self) -> bool:
         """
         Execute single instruction (one clock cycle)
@@ -158,28 +195,40 @@ class RiscVProcessor:
     def _execute_instruction(self, decoded: Dict, control_signals: Dict):
         """Execute the decoded instruction with control signals"""
         
-        instruction_name = decoded["instruction_name"]
-        
-        # Handle different instruction types
-        if decoded["type"] == "R":
-            self._execute_r_type(decoded, control_signals)
-        elif decoded["type"] == "I":
-            if instruction_name == "LW":
-                self._execute_load(decoded, control_signals)
-            else:
-                self._execute_i_type(decoded, control_signals)
-        elif decoded["type"] == "S":
-            self._execute_store(decoded, control_signals)
-        elif decoded["type"] == "B":
-            self._execute_branch(decoded, control_signals)
-        elif decoded["type"] == "J":
-            self._execute_jump(decoded, control_signals)
-        elif decoded["type"] == "Special":
-            self._execute_special(decoded, control_signals)
+        executor = self._dispatch[decoded["opcode"]] if decoded["valid"] else None
+        if executor is not None:
+            executor(decoded, control_signals)
         
         # Update PC based on control signals
         self._update_pc(control_signals, decoded)
     
+    def _build_dispatch_table(self) -> List:
+        """Build the opcode → execute method table from the decoder's ISA table"""
+        
+        executors = {
+            "R": self._execute_r_type,
+            "I": self._execute_i_type,
+            "S": self._execute_store,
+            "B": self._execute_branch,
+            "J": self._execute_jump,
+            "Special": self._execute_special,
+        }
+        
+        table = [None] * 16
+        for opcode, info in self.instruction_decoder.isa_table.items():
+            if info["name"] == "LW":
+                table[opcode] = self._execute_load
+            else:
+                table[opcode] = executors.get(info["type"])
+        return table
+    
+    def _select_executor(self, decoded: Dict):
+        """Return the execute method for a decoded instruction (None if invalid)"""
+        
+        if not decoded["valid"]:
+            return None
+        return self._dispatch[decoded["opcode"]]
+    
     def _execute_r_type(self, decoded: Dict, control_signals: Dict):
         """Execute R-type instruction (ADD, SUB, AND, OR, XOR)"""
         
@@ -326,19 +375,9 @@ class RiscVProcessor:
     def _update_statistics(self, decoded: Dict, control_signals: Dict):
         """Update execution statistics"""
         
-        inst_type = decoded["type"]
-        if inst_type in ["R"]:
-            self.stats["r_type_count"] += 1
-        elif inst_type in ["I"]:
-            self.stats["i_type_count"] += 1
-        elif inst_type in ["S"]:
-            self.stats["s_type_count"] += 1
-        elif inst_type in ["B"]:
-            self.stats["b_type_count"] += 1
-        elif inst_type in ["J"]:
-            self.stats["j_type_count"] += 1
-        elif inst_type in ["Special"]:
-            self.stats["special_count"] += 1
+        stat_key = self.TYPE_STAT_KEYS.get(decoded["type"])
+        if stat_key is not None:
+            self.stats[stat_key] += 1
     
     def _log_execution(self, decoded: Dict, control_signals: Dict):
         """Log execution for debugging"""
@@ -383,8 +422,93 @@ class RiscVProcessor:
             print(f"✅ Program completed in {cycles_executed} cycles")
             return True
     
-    def reset(self):
-        """Reset processor to initial state"""
+    def compile_program(self) -> int:
+        """
+        Pre-decode the loaded program into a per-PC dispatch table
+        
+        Decode, control signal generation and executor selection happen once
+        per instruction instead of once per cycle. Instruction memory cannot be
+        written by the program (Harvard), so the table stays valid until the
+        next program load.
+        
+        Returns:
+            int: Number of compiled instructions
+        """
+        table = []
+        
+        for pc in range(self.instruction_memory.get_program_size()):
+            decoded = self.instruction_decoder.decode(self.instruction_memory.read_instruction(pc))
+            
+            if not decoded["valid"]:
+                table.append(None)  # Invalid: handled by the generic step()
+                continue
+            
+            control_signals = self.control_unit.generate_control_signals(decoded)
+            table.append((decoded, control_signals, self._select_executor(decoded)))
+        
+        self._compiled_program = table
+        self._compiled_memory = self.instruction_memory.memory  # Replaced on every load
+        return len(table)
+    
+    def run_compiled(self, max_cycles=1000) -> bool:
+        """
+        Run program like run(), using the pre-decoded dispatch table
+        
+        Args:
+            max_cycles: Maximum number of cycles to prevent infinite loops
+            
+        Returns:
+            bool: True if completed normally
+        """
+        if self._compiled_memory is not self.instruction_memory.memory:
+            self.compile_program()
+        
+        print(f"▶️  Starting program execution (max {max_cycles} cycles)...")
+        
+        table = self._compiled_program
+        program_size = len(table)
+        update_pc = self._update_pc
+        update_statistics = self._update_statistics
+        log_execution = self._log_execution
+        
+        cycles_executed = 0
+        
+        while cycles_executed < max_cycles and not self.halted:
+            pc = self.pc
+            entry = table[pc] if pc < program_size else None
+            
+            if entry is None:
+                # End of program or invalid instruction: same path as step()
+                if not self.step():
+                    break
+            else:
+                decoded, control_signals, executor = entry
+                if executor is not None:
+                    executor(decoded, control_signals)
+                update_pc(control_signals, decoded)
+                update_statistics(decoded, control_signals)
+                log_execution(decoded, control_signals)
+                self.cycle_count += 1
+                self.instruction_count += 1
+                if self.halted:
+                    break
+            
+            cycles_executed += 1
+        
+        if cycles_executed >= max_cycles:
+            print(f"⏰ Execution stopped after {max_cycles} cycles (possible infinite loop)")
+            return False
+        else:
+            print(f"✅ Program completed in {cycles_executed} cycles")
+            return True
+    
+    def reset(self, clear_memory=True):
+        """
+        Reset processor to initial state
+        
+        Args:
+            clear_memory: Also zero data memory (in place)
+        """
         print("🔄 Resetting processor...")
         
         self.pc = 0
@@ -395,7 +519,8 @@ class RiscVProcessor:
         # Reset components
         self.register_file.reset_all()
         self.alu.reset()
-        self.data_memory.clear_memory()
+        if clear_memory:
+            self.data_memory.clear_memory()
         
         # Clear statistics and history
         for key in self.stats:
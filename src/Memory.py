@@ -1,4 +1,7 @@
 
+import sys
+from array import array
+from itertools import compress
 from typing import List, Optional
 
 
@@ -20,7 +23,7 @@ class InstructionMemory:
             size (int): Μέγεθος σε words (default: 1024)
         """
         self.size = size
-        self.memory = [0] * size  # Initialize με zeros
+        self.memory = array('H', bytes(2 * size))  # 2 bytes/word, initialized με zeros
         self.program_size = 0     # Πόσες εντολές έχουν φορτωθεί
         
         print(f"📄 Instruction Memory initialized: {size} words ({size * 2} bytes)")
@@ -30,7 +33,7 @@ class InstructionMemory:
         Φορτώνει πρόγραμμα στη μνήμη
         
         Args:
-            instructions (List[int]): Λίστα με 16-bit εντολές
+            instructions (List[int]): Λίστα (ή array('H')) με 16-bit εντολές
             start_address (int): Αρχική διεύθυνση (default: 0)
             
         Returns:
@@ -45,11 +48,15 @@ class InstructionMemory:
             return False
         
         # Καθαρισμός μνήμης
-        self.memory = [0] * self.size
+        self.memory = array('H', bytes(2 * self.size))
         
-        # Φόρτωση εντολών
-        for i, instruction in enumerate(instructions):
-            self.memory[start_address + i] = instruction & 0xFFFF
+        # Φόρτωση εντολών (ένα slice assignment)
+        end_address = start_address + len(instructions)
+        if isinstance(instructions, array) and instructions.typecode == 'H':
+            # Ήδη 16-bit: απευθείας αντιγραφή χωρίς masking ανά στοιχείο
+            self.memory[start_address:end_address] = instructions
+        else:
+            self.memory[start_address:end_address] = array('H', [instruction & 0xFFFF for instruction in instructions])
         
         self.program_size = len(instructions)
         
@@ -68,17 +75,7 @@ class InstructionMemory:
         """
         try:
             with open(filename, 'rb') as f:
-                data = f.read()
-            
-            # Μετατροπή bytes σε 16-bit instructions
-            instructions = []
-            for i in range(0, len(data), 2):
-                if i + 1 < len(data):
-                    # Little-endian 16-bit
-                    instruction = int.from_bytes(data[i:i+2], byteorder='little')
-                    instructions.append(instruction)
-            
-            return self.load_program(instructions)
+                return self.load_from_binary_stream(f)
             
         except FileNotFoundError:
             print(f"❌ Binary file not found: {filename}")
@@ -87,6 +84,26 @@ class InstructionMemory:
             print(f"❌ Error loading binary file: {e}")
             return False
     
+    def load_from_binary_stream(self, stream):
+        """
+        Φορτώνει πρόγραμμα από binary stream (ανοιχτό αρχείο, io.BytesIO)
+        
+        Args:
+            stream: Binary file-like object με little-endian 16-bit εντολές
+            
+        Returns:
+            bool: True αν επιτυχής φόρτωση
+        """
+        data = stream.read()
+        
+        # Μετατροπή bytes σε 16-bit instructions (little-endian, bulk)
+        instructions = array('H')
+        instructions.frombytes(data[:len(data) & ~1])  # Αγνοούμε μονό byte στο τέλος
+        if sys.byteorder == 'big':
+            instructions.byteswap()
+        
+        return self.load_program(instructions)
+    
     def read_instruction(self, address: int) -> int:
         """
         Διαβάζει εντολή από τη μνήμη
@@ -173,7 +190,7 @@ class DataMemory:
         """
         self.size = size
         self.base_address = base_address
-        self.memory = [0] * size
+        self.memory = array('H', bytes(2 * size))  # 2 bytes/word
         self.access_count = 0     # Στατιστικά προσβάσεων
         self.write_count = 0
         self.read_count = 0
@@ -204,8 +221,9 @@ class DataMemory:
         Returns:
             int: 16-bit value ή 0 αν invalid address
         """
-        index = self._address_to_index(address)
-        if index is not None:
+        # Inline address translation: one subtraction + one chained compare
+        index = address - self.base_address
+        if 0 <= index < self.size:
             value = self.memory[index]
             self.read_count += 1
             self.access_count += 1
@@ -226,8 +244,8 @@ class DataMemory:
         Returns:
             bool: True αν επιτυχής εγγραφή
         """
-        index = self._address_to_index(address)
-        if index is not None:
+        index = address - self.base_address
+        if 0 <= index < self.size:
             old_value = self.memory[index]
             self.memory[index] = value & 0xFFFF
             self.write_count += 1
@@ -238,13 +256,65 @@ class DataMemory:
         print(f"⚠️  Invalid write address: 0x{address:04X}")
         return False
     
+    def read_words(self, address: int, count: int) -> List[int]:
+        """
+        Διαβάζει συνεχόμενα 16-bit words με ένα slice (bulk LW)
+        
+        Args:
+            address (int): Logical address της πρώτης λέξης
+            count (int): Πλήθος λέξεων
+            
+        Returns:
+            List[int]: Οι τιμές ή κενή λίστα αν το block βγαίνει εκτός μνήμης
+        """
+        index = self._address_to_index(address)
+        if index is None or count < 0 or index + count > self.size:
+            print(f"⚠️  Invalid block read: 0x{address:04X} (+{count} words)")
+            return []
+        
+        self.read_count += count
+        self.access_count += count
+        print(f"📖 Memory Block Read: [0x{address:04X}] {count} words")
+        return list(self.memory[index:index + count])
+    
+    def write_words(self, address: int, values: List[int]) -> bool:
+        """
+        Γράφει συνεχόμενα 16-bit words με ένα slice (bulk SW)
+        
+        Args:
+            address (int): Logical address της πρώτης λέξης
+            values (List[int]): Τιμές προς εγγραφή
+            
+        Returns:
+            bool: True αν όλο το block χωράει στη μνήμη
+        """
+        index = self._address_to_index(address)
+        count = len(values)
+        if index is None or index + count > self.size:
+            print(f"⚠️  Invalid block write: 0x{address:04X} (+{count} words)")
+            return False
+        
+        self.memory[index:index + count] = array('H', [value & 0xFFFF for value in values])
+        self.write_count += count
+        self.access_count += count
+        print(f"✏️  Memory Block Write: [0x{address:04X}] {count} words")
+        return True
+    
     def clear_memory(self):
         """Καθαρίζει όλη τη μνήμη"""
-        self.memory = [0] * self.size
+        # Μηδενισμός in place με ένα memset-style copy (ίδιο array object)
+        with memoryview(self.memory) as words:
+            words.cast('B')[:] = bytes(words.nbytes)
         print("🧹 Data memory cleared")
     
     def get_statistics(self) -> dict:
-        """Επιστρέφει στατιστικά προσβάσεων"""
+        """
+        Επιστρέφει στατιστικά προσβάσεων
+        
+        O(1): οι counters ενημερώνονται ανά access, οπότε δεν χρειάζεται cache
+        (ένα cache θα ήθελε invalidation σε κάθε read/write, στο hot path).
+        Κάθε κλήση δίνει νέο dict, ασφαλές για αποθήκευση ως snapshot.
+        """
         return {
             'total_accesses': self.access_count,
             'reads': self.read_count,
@@ -291,12 +361,10 @@ class DataMemory:
         Returns:
             List[tuple]: (address, value) pairs
         """
-        non_zero = []
-        for i, value in enumerate(self.memory):
-            if value != 0:
-                address = self.base_address + i
-                non_zero.append((address, value))
-        return non_zero
+        # compress() skips zero words in C; Python work is only per non-zero word
+        memory = self.memory
+        base = self.base_address
+        return [(base + i, memory[i]) for i in compress(range(self.size), memory)]
 
 
 # Demo και testing functions
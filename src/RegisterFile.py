@@ -122,6 +122,15 @@ class RegisterFile:
             return self.registers[reg_num].write(value)
         return False
     
+    def read_all(self):
+        """
+        Read all 16 registers at once
+        
+        Returns:
+            list: Register values x0-x15
+        """
+        return [register._value for register in self.registers]
+    
     def reset_all(self):
         """Reset all registers to 0 (except x0 which stays 0)"""
         for register in self.registers:
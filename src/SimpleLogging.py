@@ -277,12 +277,12 @@ def add_logging_to_processor(processor_class):
             
             return result
         
-        def reset(self):
+        def reset(self, clear_memory=True):
             """Enhanced reset με logging"""
             if self.logger:
                 self.logger.log("🔄 Resetting processor", "INFO")
             
-            super().reset()
+            super().reset(clear_memory)
             
             if self.logger:
                 self.logger.log_success("Processor reset completed")
@@ -373,6 +373,33 @@ class AssemblerTests:
 
         print("   Negative ADDI decrements and loop terminates")
 
+    def test_assemble_source(self):
+        """Test in-memory assembling από string"""
+        print("Testing assembling from a source string...")
+
+        test_code = """
+        main:
+            addi x1, x0, 3
+        loop:
+            addi x1, x1, -1
+            bne x1, x0, loop
+            sw x1, 0(x0)
+            halt
+        """
+
+        assembler = RiscVAssembler()
+
+        source_code = assembler.assemble_source(test_code)
+        file_code = self._assemble_temp_asm(assembler, 'test_source.asm', test_code)
+
+        if source_code != file_code:
+            raise AssertionError(f"Source and file assembly differ: {source_code} vs {file_code}")
+
+        if len(source_code) != 5:
+            raise AssertionError(f"Expected 5 instructions, got {len(source_code)}")
+
+        print("   ✓ assemble_source matches assemble_file")
+
     def run_all_tests(self):
         """Εκτελεί όλα τα tests"""
         print("=" * 60)
@@ -389,6 +416,7 @@ class AssemblerTests:
         self.run_test("Complete Program", self.test_complete_program)
         self.run_test("ABI Register Names", self.test_abi_register_names)
         self.run_test("Negative ADDI Execution", self.test_negative_addi_execution)
+        self.run_test("Assemble Source", self.test_assemble_source)
         
         # Εμφάνιση αποτελεσμάτων
         print("\n" + "=" * 60)
@@ -424,7 +452,8 @@ def run_individual_test(test_name: str):
         'error': tests.test_error_handling,
         'complete': tests.test_complete_program,
         'abi': tests.test_abi_register_names,
-        'negative-addi': tests.test_negative_addi_execution
+        'negative-addi': tests.test_negative_addi_execution,
+        'source': tests.test_assemble_source
     }
     
     if test_name.lower() in test_methods:
@@ -17,13 +17,72 @@ from test_utils import add_src_to_path, configure_utf8_stdio
 configure_utf8_stdio()
 add_src_to_path()
 
+import os
 import time
 import threading
+import itertools
 from collections import deque
 import tkinter as tk
 from tkinter import ttk
 import json
 import datetime
+from pathlib import Path
+from dataclasses import dataclass, asdict
+from typing import List
+
+# JSON encoder for exports: orjson → ujson → stdlib json (all return bytes)
+try:
+    import orjson  # Optional: fastest encoder
+    _json_dumps = orjson.dumps
+except ImportError:
+    try:
+        import ujson as _json_backend  # Optional fallback
+    except ImportError:
+        _json_backend = json
+    
+    def _json_dumps(obj):
+        return _json_backend.dumps(obj).encode('utf-8')
+
+# Precomputed 4-digit hex strings for every 16-bit value (display hot path)
+_HEX4 = ['%04X' % i for i in range(1 << 16)]
+
+# Per-metric block of the statistics tab (one template walk per metric)
+_STATS_TMPL = (
+    "\n{0}:\n"
+    "  Current: {1:.2f}\n"
+    "  Average: {2:.2f}\n"
+    "  Maximum: {3:.2f}\n"
+    "  Minimum: {4:.2f}\n"
+)
+
+# Order of the values returned by ProcessorMonitor._calculate_metrics
+METRIC_FIELDS = (
+    'cycle_rate', 'instruction_rate', 'memory_read_rate', 'memory_write_rate',
+    'register_changes', 'alu_rate', 'branch_rate', 'time_delta'
+)
+
+
+@dataclass
+class Snapshot:
+    """Flat processor state snapshot (slotted, no per-key dict lookups)"""
+    __slots__ = ('timestamp', 'pc', 'cycles', 'instructions', 'halted',
+                 'registers', 'alu_ops', 'mem_reads', 'mem_writes', 'branches_taken')
+    
+    timestamp: int  # time.monotonic_ns()
+    pc: int
+    cycles: int
+    instructions: int
+    halted: bool
+    registers: List[int]
+    alu_ops: int
+    mem_reads: int
+    mem_writes: int
+    branches_taken: int
+    
+    def as_dict(self):
+        """Dictionary view για callbacks που περιμένουν dict"""
+        return asdict(self)
+
 
 class ProcessorMonitor:
     """Real-time processor monitoring"""
@@ -63,7 +122,9 @@ class ProcessorMonitor:
                     metrics = self._calculate_metrics(self.last_snapshot, current_snapshot)
                     self._record_metrics(metrics)
                     
-                    # Notify callbacks
+                    # Notify callbacks (they receive a dict keyed by METRIC_FIELDS)
+                    if self.callbacks:
+                        metrics = dict(zip(METRIC_FIELDS, metrics))
                     for callback in self.callbacks:
                         try:
                             callback(metrics, current_snapshot)
@@ -82,67 +143,53 @@ class ProcessorMonitor:
     
     def _take_snapshot(self):
         """Take processor state snapshot"""
-        return {
-            'timestamp': time.time(),
-            'pc': self.processor.pc,
-            'cycles': self.processor.cycle_count,
-            'instructions': self.processor.instruction_count,
-            'halted': self.processor.halted,
-            'registers': [self.processor.register_file.read(i) for i in range(16)],
-            'alu_ops': self.processor.alu.operations_count,
-            'memory_stats': self.processor.data_memory.get_statistics(),
-            'processor_stats': dict(self.processor.stats)
-        }
+        processor = self.processor
+        data_memory = processor.data_memory
+        return Snapshot(
+            timestamp=time.monotonic_ns(),
+            pc=processor.pc,
+            cycles=processor.cycle_count,
+            instructions=processor.instruction_count,
+            halted=processor.halted,
+            registers=processor.register_file.read_all(),
+            alu_ops=processor.alu.operations_count,
+            mem_reads=data_memory.read_count,
+            mem_writes=data_memory.write_count,
+            branches_taken=processor.stats['branches_taken']
+        )
     
     def _calculate_metrics(self, last, current):
-        """Calculate performance metrics"""
-        time_delta = current['timestamp'] - last['timestamp']
-        
-        if time_delta == 0:
-            time_delta = 0.001  # Avoid division by zero
-        
-        # Calculate rates
-        cycle_rate = (current['cycles'] - last['cycles']) / time_delta
-        instruction_rate = (current['instructions'] - last['instructions']) / time_delta
-        
-        # Memory operation deltas
-        mem_reads = current['memory_stats']['reads'] - last['memory_stats']['reads']
-        mem_writes = current['memory_stats']['writes'] - last['memory_stats']['writes']
-        
-        # Register changes
-        reg_changes = sum(1 for i in range(16) 
-                         if current['registers'][i] != last['registers'][i])
-        
-        # ALU operations
-        alu_ops = current['alu_ops'] - last['alu_ops']
-        
-        # Branch statistics
-        branches_taken = (current['processor_stats']['branches_taken'] - 
-                         last['processor_stats']['branches_taken'])
-        
-        return {
-            'cycle_rate': cycle_rate,
-            'instruction_rate': instruction_rate,
-            'memory_read_rate': mem_reads / time_delta,
-            'memory_write_rate': mem_writes / time_delta,
-            'register_changes': reg_changes,
-            'alu_rate': alu_ops / time_delta,
-            'branch_rate': branches_taken / time_delta,
-            'time_delta': time_delta
-        }
+        """Calculate performance metrics as a tuple ordered like METRIC_FIELDS"""
+        delta_ns = max(current.timestamp - last.timestamp, 1)  # Avoid division by zero
+        per_second = 1e9 / delta_ns
+        
+        register_changes = sum(a != b for a, b in zip(current.registers, last.registers))
+        
+        return (
+            (current.cycles - last.cycles) * per_second,
+            (current.instructions - last.instructions) * per_second,
+            (current.mem_reads - last.mem_reads) * per_second,
+            (current.mem_writes - last.mem_writes) * per_second,
+            register_changes,
+            (current.alu_ops - last.alu_ops) * per_second,
+            (current.branches_taken - last.branches_taken) * per_second,
+            delta_ns / 1e9
+        )
     
     def _record_metrics(self, metrics):
         """Record metrics in history"""
-        timestamp = time.time()
-        
-        self.metrics_history['cycles'].append(metrics['cycle_rate'])
-        self.metrics_history['instructions'].append(metrics['instruction_rate'])
-        self.metrics_history['memory_reads'].append(metrics['memory_read_rate'])
-        self.metrics_history['memory_writes'].append(metrics['memory_write_rate'])
-        self.metrics_history['register_changes'].append(metrics['register_changes'])
-        self.metrics_history['alu_operations'].append(metrics['alu_rate'])
-        self.metrics_history['branch_taken'].append(metrics['branch_rate'])
-        self.metrics_history['timestamps'].append(timestamp)
+        (cycle_rate, instruction_rate, read_rate, write_rate,
+         register_changes, alu_rate, branch_rate, _) = metrics
+        history = self.metrics_history
+        
+        history['cycles'].append(cycle_rate)
+        history['instructions'].append(instruction_rate)
+        history['memory_reads'].append(read_rate)
+        history['memory_writes'].append(write_rate)
+        history['register_changes'].append(register_changes)
+        history['alu_operations'].append(alu_rate)
+        history['branch_taken'].append(branch_rate)
+        history['timestamps'].append(time.time())
     
     def get_metrics_summary(self):
         """Get metrics summary"""
@@ -165,6 +212,17 @@ class ProcessorMonitor:
 class MonitoringDashboard:
     """GUI Dashboard για monitoring"""
     
+    FLUSH_INTERVAL_MS = 33  # Coalesce redraws to at most ~30 FPS
+    
+    # Notebook tab positions (see create_details_panel)
+    STATE_TAB_INDEX = 0
+    MEMORY_TAB_INDEX = 1
+    TRACE_TAB_INDEX = 2
+    STATS_TAB_INDEX = 3
+    
+    TRACE_CAPACITY = 1000     # Executed instructions kept for the trace tab
+    TRACE_VISIBLE_ROWS = 15   # Rows rendered in the trace Treeview
+    
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("📊 RISC-V Monitoring Dashboard")
@@ -173,6 +231,20 @@ class MonitoringDashboard:
         
         self.processor = None
         self.monitor = None
+        self._last_rendered_cycles = None
+        self._last_stats_text = None  # Text currently shown in the stats tab
+        self._last_export_cycles = None  # cycle_count of the last written export
+        
+        # Coalesced redraw state (written by the monitor thread)
+        self._latest_metrics = None
+        self._metrics_dirty = False
+        self._flush_pending = False
+        
+        # Execution trace ring buffer; the Treeview only shows a window of it
+        self._trace_ring = deque(maxlen=self.TRACE_CAPACITY)
+        self._trace_offset = 0
+        self._trace_follow = True
+        self._last_traced_cycle = -1
         
         self.create_dashboard()
         self.load_test_processor()
@@ -279,6 +351,10 @@ class MonitoringDashboard:
             
             self.metric_values[name] = value_label
         
+        # Bound configure methods in METRIC_FIELDS order (panel order above)
+        self._metric_configure = [self.metric_values[name].configure for name, _ in metrics]
+        self._metric_texts = [None] * len(metrics)
+        
         # Performance graph area
         graph_frame = tk.Frame(parent, bg="#434C5E", height=200)
         graph_frame.pack(fill=tk.X, padx=10, pady=10)
@@ -329,6 +405,8 @@ class MonitoringDashboard:
         self.notebook.add(stats_frame, text="📊 Statistics")
         
         self.create_statistics_tab(stats_frame)
+        
+        self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
     
     def create_processor_state_tab(self, parent):
         """Create processor state display"""
@@ -487,9 +565,9 @@ class MonitoringDashboard:
         # Create treeview for trace
         self.trace_tree = ttk.Treeview(
             trace_frame,
-            columns=("Cycle", "PC", "Instruction", "Assembly", "Changes"),
+            columns=("Cycle", "PC", "Instruction", "Assembly", "Type"),
             show="headings",
-            height=15
+            height=self.TRACE_VISIBLE_ROWS
         )
         
         # Configure columns
@@ -497,20 +575,22 @@ class MonitoringDashboard:
         self.trace_tree.heading("PC", text="PC")
         self.trace_tree.heading("Instruction", text="Instruction")
         self.trace_tree.heading("Assembly", text="Assembly")
-        self.trace_tree.heading("Changes", text="Changes")
+        self.trace_tree.heading("Type", text="Type")
         
         self.trace_tree.column("Cycle", width=60)
         self.trace_tree.column("PC", width=80)
         self.trace_tree.column("Instruction", width=100)
         self.trace_tree.column("Assembly", width=200)
-        self.trace_tree.column("Changes", width=150)
+        self.trace_tree.column("Type", width=150)
         
-        # Scrollbar for trace
-        trace_scrollbar = ttk.Scrollbar(trace_frame, command=self.trace_tree.yview)
-        self.trace_tree.configure(yscrollcommand=trace_scrollbar.set)
+        # Scrollbar moves a window over the trace ring buffer (virtual list)
+        self.trace_scrollbar = ttk.Scrollbar(trace_frame, command=self.scroll_trace)
+        self.trace_tree.bind("<MouseWheel>", self._on_trace_wheel)
+        self.trace_tree.bind("<Button-4>", lambda e: self.scroll_trace('scroll', -1, 'units'))
+        self.trace_tree.bind("<Button-5>", lambda e: self.scroll_trace('scroll', 1, 'units'))
         
         self.trace_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        trace_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.trace_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
     
     def create_statistics_tab(self, parent):
         """Create statistics tab"""
@@ -657,11 +737,10 @@ class MonitoringDashboard:
         """Reset processor"""
         if self.processor:
             self.processor.reset()
+            self._last_rendered_cycles = None
+            self._last_export_cycles = None
+            self.clear_trace()
             self.update_static_display()
-            
-            # Clear trace
-            for item in self.trace_tree.get_children():
-                self.trace_tree.delete(item)
     
     def load_program(self):
         """Load new program"""
@@ -677,46 +756,82 @@ class MonitoringDashboard:
             program = random.choice(sample_programs)
             self.processor.reset()
             self.processor.load_program_direct(program)
+            self._last_rendered_cycles = None
+            self._last_export_cycles = None
+            self.clear_trace()
             self.update_static_display()
     
     def update_display(self, metrics, snapshot):
-        """Update display with new metrics"""
-        # Update metrics
-        metric_mapping = {
-            "🔄 Cycle Rate": metrics.get('cycle_rate', 0),
-            "📋 Instruction Rate": metrics.get('instruction_rate', 0),
-            "📖 Memory Reads": metrics.get('memory_read_rate', 0),
-            "✏️ Memory Writes": metrics.get('memory_write_rate', 0),
-            "🗂️ Register Changes": metrics.get('register_changes', 0),
-            "⚙️ ALU Operations": metrics.get('alu_rate', 0),
-            "🔀 Branch Rate": metrics.get('branch_rate', 0)
-        }
+        """Record new metrics and schedule a single coalesced redraw"""
+        self._latest_metrics = metrics
+        self._metrics_dirty = True
+        
+        if not self._flush_pending:
+            self._flush_pending = True
+            self.root.after(self.FLUSH_INTERVAL_MS, self._flush_if_dirty)
+    
+    def _flush_if_dirty(self):
+        """Redraw once with the latest metrics received since the last flush"""
+        self._flush_pending = False
+        if not self._metrics_dirty:
+            return
+        self._metrics_dirty = False
+        metrics = self._latest_metrics
         
-        for name, value in metric_mapping.items():
-            if name in self.metric_values:
-                self.metric_values[name].configure(text=f"{value:.2f}")
+        # Update metrics (skip labels whose text did not change)
+        texts = self._metric_texts
+        for i, (configure, field) in enumerate(zip(self._metric_configure, METRIC_FIELDS)):
+            text = f"{metrics.get(field, 0):.2f}"
+            if text != texts[i]:
+                texts[i] = text
+                configure(text=text)
         
         # Update graph
         self.update_performance_graph()
         
         # Update static display
-        self.root.after(0, self.update_static_display)
+        self.update_static_display()
+        
+        # Metrics that arrived while redrawing get their own flush
+        if self._metrics_dirty and not self._flush_pending:
+            self._flush_pending = True
+            self.root.after(self.FLUSH_INTERVAL_MS, self._flush_if_dirty)
     
     def update_static_display(self):
-        """Update static processor information"""
+        """Update static processor information for the visible tab"""
         if not self.processor:
             return
         
-        # Update processor state
-        self.pc_label.configure(text=f"PC: 0x{self.processor.pc:04X}")
+        visible_tab = self.notebook.index('current')
+        
+        if visible_tab == self.STATE_TAB_INDEX:
+            self.update_processor_state_display()
+        
+        # Memory and statistics only change when the processor advances
+        if self.processor.cycle_count == self._last_rendered_cycles:
+            return
+        self._last_rendered_cycles = self.processor.cycle_count
+        
+        self.collect_trace()
+        
+        if visible_tab == self.MEMORY_TAB_INDEX:
+            self.update_memory_display()
+        elif visible_tab == self.TRACE_TAB_INDEX:
+            self.update_trace_display()
+        elif visible_tab == self.STATS_TAB_INDEX:
+            self.update_statistics_display()
+    
+    def update_processor_state_display(self):
+        """Update PC, status and register panel"""
+        self.pc_label.configure(text="PC: 0x" + _HEX4[self.processor.pc & 0xFFFF])
         status = "HALTED" if self.processor.halted else "RUNNING"
         self.status_label.configure(text=f"Status: {status}")
         self.cycles_label.configure(text=f"Cycles: {self.processor.cycle_count}")
         
-        # Update registers
-        for i in range(16):
-            value = self.processor.register_file.read(i)
-            self.register_labels[i].configure(text=f"0x{value:04X}")
+        # Update registers (one bulk copy per frame)
+        registers = self.processor.register_file.read_all()
+        for i, value in enumerate(registers):
+            self.register_labels[i].configure(text="0x" + _HEX4[value])
             
             # Highlight changed registers
             if hasattr(self, 'last_register_values'):
@@ -725,13 +840,12 @@ class MonitoringDashboard:
                 else:
                     self.register_labels[i].configure(fg="#A3BE8C")  # Green for normal
         
-        self.last_register_values = [self.processor.register_file.read(i) for i in range(16)]
-        
-        # Update memory
-        self.update_memory_display()
-        
-        # Update statistics
-        self.update_statistics_display()
+        self.last_register_values = registers
+    
+    def on_tab_changed(self, event=None):
+        """Force a full refresh when the user switches tabs"""
+        self._last_rendered_cycles = None
+        self.update_static_display()
     
     def update_memory_display(self):
         """Update memory display"""
@@ -740,9 +854,6 @@ class MonitoringDashboard:
         
         # Memory statistics
         stats = self.processor.data_memory.get_statistics()
-        self.memory_stats_text.configure(state=tk.NORMAL)
-        self.memory_stats_text.delete(1.0, tk.END)
-        
         stats_text = f"""Memory Statistics:
 Total Accesses: {stats['total_accesses']}
 Reads: {stats['reads']}
@@ -750,24 +861,89 @@ Writes: {stats['writes']}
 Memory Size: {stats['size']} words
 Base Address: 0x{stats['base_address']:04X}
 """
-        self.memory_stats_text.insert(1.0, stats_text)
-        self.memory_stats_text.configure(state=tk.DISABLED)
+        self._replace_text(self.memory_stats_text, stats_text)
         
         # Memory contents
         non_zero = self.processor.data_memory.find_non_zero()
-        self.memory_text.configure(state=tk.NORMAL)
-        self.memory_text.delete(1.0, tk.END)
         
         if non_zero:
-            self.memory_text.insert(tk.END, "Address  | Value  | Decimal\n")
-            self.memory_text.insert(tk.END, "-" * 30 + "\n")
-            
+            lines = ["Address  | Value  | Decimal\n", "-" * 30 + "\n"]
             for addr, value in non_zero[:20]:  # Show first 20
-                self.memory_text.insert(tk.END, f"0x{addr:04X}   | 0x{value:04X} | {value:>5}\n")
+                lines.append(f"0x{_HEX4[addr & 0xFFFF]}   | 0x{_HEX4[value]} | {value:>5}\n")
+            memory_text = ''.join(lines)
         else:
-            self.memory_text.insert(tk.END, "No data stored in memory")
+            memory_text = "No data stored in memory"
         
-        self.memory_text.configure(state=tk.DISABLED)
+        self._replace_text(self.memory_text, memory_text)
+    
+    def _replace_text(self, widget, text):
+        """Replace a read-only Text widget's contents with one bulk insert"""
+        widget.configure(state=tk.NORMAL)
+        widget.delete(1.0, tk.END)
+        widget.insert(1.0, text)
+        widget.configure(state=tk.DISABLED)
+    
+    def collect_trace(self):
+        """Append newly executed instructions to the trace ring buffer"""
+        for entry in self.processor.execution_history:
+            cycle = entry["cycle"]
+            if cycle > self._last_traced_cycle:
+                self._trace_ring.append((
+                    cycle,
+                    "0x" + _HEX4[entry["pc"] & 0xFFFF],
+                    "0x" + _HEX4[entry["instruction"] & 0xFFFF],
+                    entry["assembly"],
+                    entry["type"]
+                ))
+                self._last_traced_cycle = cycle
+    
+    def clear_trace(self):
+        """Empty the trace ring buffer and the Treeview window"""
+        self._trace_ring.clear()
+        self._trace_offset = 0
+        self._trace_follow = True
+        self._last_traced_cycle = -1
+        self.update_trace_display()
+    
+    def update_trace_display(self):
+        """Render only the visible window of the trace ring buffer"""
+        total = len(self._trace_ring)
+        rows = self.TRACE_VISIBLE_ROWS
+        
+        if self._trace_follow:
+            self._trace_offset = max(total - rows, 0)
+        start = self._trace_offset
+        
+        children = self.trace_tree.get_children()
+        if children:
+            self.trace_tree.delete(*children)
+        for values in itertools.islice(self._trace_ring, start, start + rows):
+            self.trace_tree.insert("", tk.END, values=values)
+        
+        if total:
+            self.trace_scrollbar.set(start / total, min(start + rows, total) / total)
+        else:
+            self.trace_scrollbar.set(0.0, 1.0)
+    
+    def scroll_trace(self, *args):
+        """Scrollbar callback: move the visible window over the ring buffer"""
+        total = len(self._trace_ring)
+        max_offset = max(total - self.TRACE_VISIBLE_ROWS, 0)
+        
+        if args[0] == 'moveto':
+            offset = int(float(args[1]) * total)
+        else:  # ('scroll', amount, 'units' | 'pages')
+            step = self.TRACE_VISIBLE_ROWS if args[2] == 'pages' else 1
+            offset = self._trace_offset + int(args[1]) * step
+        
+        self._trace_offset = min(max(offset, 0), max_offset)
+        self._trace_follow = self._trace_offset == max_offset
+        self.update_trace_display()
+    
+    def _on_trace_wheel(self, event):
+        """Mouse wheel scrolling for the trace window"""
+        self.scroll_trace('scroll', -1 if event.delta > 0 else 1, 'units')
+        return "break"
     
     def update_performance_graph(self):
         """Update performance graph"""
@@ -817,9 +993,6 @@ Base Address: 0x{stats['base_address']:04X}
         if not self.processor:
             return
         
-        self.stats_text.configure(state=tk.NORMAL)
-        self.stats_text.delete(1.0, tk.END)
-        
         # Processor statistics
         stats_text = f"""📊 PROCESSOR STATISTICS
 {'='*40}
@@ -853,25 +1026,34 @@ ALU Operations: {self.processor.alu.operations_count}
         if self.monitor:
             summary = self.monitor.get_metrics_summary()
             if summary:
-                stats_text += f"\n📈 MONITORING STATISTICS\n{'='*40}\n"
+                parts = [stats_text, f"\n📈 MONITORING STATISTICS\n{'='*40}\n"]
                 for metric, data in summary.items():
-                    stats_text += f"\n{metric.replace('_', ' ').title()}:\n"
-                    stats_text += f"  Current: {data['current']:.2f}\n"
-                    stats_text += f"  Average: {data['average']:.2f}\n"
-                    stats_text += f"  Maximum: {data['maximum']:.2f}\n"
-                    stats_text += f"  Minimum: {data['minimum']:.2f}\n"
-        
-        self.stats_text.insert(1.0, stats_text)
-        self.stats_text.configure(state=tk.DISABLED)
+                    parts.append(_STATS_TMPL.format(
+                        metric.replace('_', ' ').title(),
+                        data['current'], data['average'],
+                        data['maximum'], data['minimum']
+                    ))
+                stats_text = ''.join(parts)
+        
+        # Skip the Text delete/insert (and re-layout) when nothing changed
+        if stats_text == self._last_stats_text:
+            return
+        self._last_stats_text = stats_text
+        self._replace_text(self.stats_text, stats_text)
     
     def export_monitoring_data(self):
         """Export monitoring data to file"""
         if not self.monitor:
             return
         
+        # Nothing new since the last export: skip the whole JSON encode
+        if self.processor.cycle_count == self._last_export_cycles:
+            print("ℹ️ No new monitoring data since last export, skipping")
+            return
+        
         try:
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"risc_v_monitoring_{timestamp}.json"
+            path = Path(f"risc_v_monitoring_{timestamp}.json")
             
             # Prepare data for export
             export_data = {
@@ -881,27 +1063,41 @@ ALU Operations: {self.processor.alu.operations_count}
                     'cycles': self.processor.cycle_count,
                     'instructions': self.processor.instruction_count,
                     'halted': self.processor.halted,
-                    'registers': [self.processor.register_file.read(i) for i in range(16)]
+                    'registers': self.processor.register_file.read_all()
                 },
+                # list(deque) is one presized C-level copy per metric
                 'metrics_history': {
                     key: list(values) for key, values in self.monitor.metrics_history.items()
                 },
-                'statistics': dict(self.processor.stats),
+                # Plain dict, serialized right below: no copy needed
+                'statistics': self.processor.stats,
                 'memory_stats': self.processor.data_memory.get_statistics()
             }
             
-            with open(filename, 'w') as f:
-                json.dump(export_data, f, indent=2)
+            # Serialize once (compact, no indent), then write in a single call
+            payload = _json_dumps(export_data)
+            
+            # Write to a temp file and rename, so a crash never leaves a partial export
+            tmp_path = path.with_name(path.name + '.tmp')
+            try:
+                with tmp_path.open('wb', buffering=1 << 20) as f:
+                    f.write(payload)
+                os.replace(tmp_path, path)
+                self._last_export_cycles = self.processor.cycle_count
+            except OSError:
+                if tmp_path.exists():
+                    tmp_path.unlink()
+                raise
             
-            print(f"✅ Monitoring data exported to {filename}")
+            print(f"✅ Monitoring data exported to {path}")
             
         except Exception as e:
             print(f"❌ Error exporting data: {e}")
     
     def run(self):
         """Run the dashboard"""
-        # Start with a small delay to ensure proper initialization
-        self.root.after(100, self.update_static_display)
+        # First paint as soon as the event loop is idle
+        self.root.after_idle(self.update_static_display)
         self.root.mainloop()
 
 
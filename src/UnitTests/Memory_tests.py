@@ -11,9 +11,11 @@ Unit Tests για το Memory System
 - Test memory statistics
 """
 
+import io
 import os
 import sys
 import tempfile
+from contextlib import redirect_stdout
 from test_utils import add_src_to_path, configure_utf8_stdio
 
 # Προσθήκη του parent directory στο Python path
@@ -26,14 +28,20 @@ from Memory import InstructionMemory, DataMemory
 class MemoryTests:
     """Test suite για το Memory System"""
     
-    def __init__(self):
+    def __init__(self, quiet=False):
         self.test_count = 0
         self.passed_tests = 0
         self.failed_tests = 0
+        self.quiet = quiet   # One line per test, test output captured
+        self.results = []    # Quiet-mode result lines, written once
     
     def run_test(self, test_name: str, test_func):
         """Εκτελεί ένα test"""
         self.test_count += 1
+        if self.quiet:
+            self._run_test_quiet(test_name, test_func)
+            return
+        
         print(f"\n🧪 Test {self.test_count}: {test_name}")
         print("─" * 50)
         
@@ -46,6 +54,17 @@ class MemoryTests:
             print(f"❌ FAILED: {test_name}")
             print(f"   Error: {e}")
     
+    def _run_test_quiet(self, test_name: str, test_func):
+        """Εκτελεί ένα test χωρίς output, κρατώντας μόνο ένα result line"""
+        try:
+            with redirect_stdout(io.StringIO()):
+                test_func()
+            self.passed_tests += 1
+            self.results.append(f"✅ {test_name}")
+        except Exception as e:
+            self.failed_tests += 1
+            self.results.append(f"❌ {test_name}: {e}")
+    
     def test_instruction_memory_basic(self):
         """Test βασικών λειτουργιών InstructionMemory"""
         print("Testing InstructionMemory basic operations...")
@@ -74,8 +93,9 @@ class MemoryTests:
             raise AssertionError(f"Program size should be 4, got {imem.program_size}")
         
         # Test reading loaded instructions
+        read_instruction = imem.read_instruction
         for i, expected in enumerate(test_program):
-            instruction = imem.read_instruction(i)
+            instruction = read_instruction(i)
             if instruction != expected:
                 raise AssertionError(f"Instruction {i}: expected 0x{expected:04X}, got 0x{instruction:04X}")
         
@@ -90,9 +110,10 @@ class MemoryTests:
         imem = InstructionMemory(size=10)  # Small memory για testing
         
         # Test invalid addresses
+        read_instruction = imem.read_instruction
         invalid_addresses = [-1, 10, 100, 0xFFFF]
         for addr in invalid_addresses:
-            instruction = imem.read_instruction(addr)
+            instruction = read_instruction(addr)
             if instruction != 0:
                 raise AssertionError(f"Invalid address {addr} should return 0")
         
@@ -123,33 +144,44 @@ class MemoryTests:
         
         imem = InstructionMemory(size=256)
         
-        # Create temporary binary file
         test_data = [0x510A, 0x5205, 0x0312, 0xF000]
+        binary = b''.join(instruction.to_bytes(2, byteorder='little') for instruction in test_data)
+        
+        # Test loading from an in-memory stream
+        success = imem.load_from_binary_stream(io.BytesIO(binary))
+        if not success:
+            raise AssertionError("Binary stream loading should succeed")
         
+        # Verify loaded data
+        read_instruction = imem.read_instruction
+        for i, expected in enumerate(test_data):
+            instruction = read_instruction(i)
+            if instruction != expected:
+                raise AssertionError(f"Binary data {i}: expected 0x{expected:04X}, got 0x{instruction:04X}")
+        
+        # Create temporary binary file (disk path coverage)
         with tempfile.NamedTemporaryFile(mode='wb', delete=False, suffix='.bin') as f:
-            for instruction in test_data:
-                f.write(instruction.to_bytes(2, byteorder='little'))
+            f.write(binary)
             temp_filename = f.name
         
         try:
             # Test loading binary file
+            imem = InstructionMemory(size=256)
             success = imem.load_from_binary_file(temp_filename)
             if not success:
                 raise AssertionError("Binary file loading should succeed")
             
-            # Verify loaded data
-            for i, expected in enumerate(test_data):
-                instruction = imem.read_instruction(i)
-                if instruction != expected:
-                    raise AssertionError(f"Binary data {i}: expected 0x{expected:04X}, got 0x{instruction:04X}")
+            if imem.program_size != len(test_data) or imem.read_instruction(3) != 0xF000:
+                raise AssertionError("Binary file contents not loaded correctly")
             
             # Test loading non-existent file
             success = imem.load_from_binary_file("non_existent_file.bin")
             if success:
                 raise AssertionError("Loading non-existent file should fail")
             
-            print(f"   ✓ Binary file loading works")
+            print(f"   ✓ Binary stream loading works")
             print(f"   ✓ Data verification works")
+            print(f"   ✓ Binary file loading works")
             print(f"   ✓ Error handling works")
             
         finally:
@@ -181,12 +213,13 @@ class MemoryTests:
             (0x10FF, 0xABCD)  # Last valid address
         ]
         
+        write_word, read_word = dmem.write_word, dmem.read_word
         for address, value in test_data:
-            success = dmem.write_word(address, value)
+            success = write_word(address, value)
             if not success:
                 raise AssertionError(f"Write to 0x{address:04X} should succeed")
             
-            read_value = dmem.read_word(address)
+            read_value = read_word(address)
             if read_value != value:
                 raise AssertionError(f"Address 0x{address:04X}: expected 0x{value:04X}, got 0x{read_value:04X}")
         
@@ -200,21 +233,23 @@ class MemoryTests:
         
         dmem = DataMemory(size=10, base_address=0x2000)
         
+        write_word, read_word = dmem.write_word, dmem.read_word
+        
         # Test valid addresses
         valid_addresses = [0x2000, 0x2005, 0x2009]  # 0x2009 = last valid
         for addr in valid_addresses:
-            success = dmem.write_word(addr, 0x1234)
+            success = write_word(addr, 0x1234)
             if not success:
                 raise AssertionError(f"Valid address 0x{addr:04X} should succeed")
         
         # Test invalid addresses (outside range)
         invalid_addresses = [0x1FFF, 0x200A, 0x3000, 0x0000]
         for addr in invalid_addresses:
-            success = dmem.write_word(addr, 0x1234)
+            success = write_word(addr, 0x1234)
             if success:
                 raise AssertionError(f"Invalid address 0x{addr:04X} should fail")
             
-            value = dmem.read_word(addr)
+            value = read_word(addr)
             if value != 0:
                 raise AssertionError(f"Invalid read should return 0, got 0x{value:04X}")
         
@@ -236,11 +271,12 @@ class MemoryTests:
             raise AssertionError("Initial read/write counts should be 0")
         
         # Perform operations
-        dmem.write_word(0x1000, 0x1111)  # 1 write
-        dmem.write_word(0x1001, 0x2222)  # 1 write
-        dmem.read_word(0x1000)           # 1 read
-        dmem.read_word(0x1001)           # 1 read
-        dmem.read_word(0x1000)           # 1 read
+        write_word, read_word = dmem.write_word, dmem.read_word
+        write_word(0x1000, 0x1111)  # 1 write
+        write_word(0x1001, 0x2222)  # 1 write
+        read_word(0x1000)           # 1 read
+        read_word(0x1001)           # 1 read
+        read_word(0x1000)           # 1 read
         
         # Check statistics
         stats = dmem.get_statistics()
@@ -268,21 +304,27 @@ class MemoryTests:
         dmem = DataMemory(size=10)
         
         # Test large values that should be masked
-        test_cases = [
-            (0x10000, 0x0000),   # Should wrap to 0
-            (0x12345, 0x2345),   # Should mask to lower 16 bits
-            (0xFFFFF, 0xFFFF),   # Should mask to 0xFFFF
-            (0xABCDE, 0xBCDE)    # Should mask to lower 16 bits
-        ]
+        inputs = [0x10000, 0x12345, 0xFFFFF, 0xABCDE]
+        expected = [0x0000, 0x2345, 0xFFFF, 0xBCDE]  # Lower 16 bits
         
-        for input_value, expected_output in test_cases:
-            dmem.write_word(0x1000, input_value)
-            stored_value = dmem.read_word(0x1000)
+        write_word, read_word = dmem.write_word, dmem.read_word
+        for input_value, expected_output in zip(inputs, expected):
+            write_word(0x1000, input_value)
+            stored_value = read_word(0x1000)
             
             if stored_value != expected_output:
                 raise AssertionError(f"Input 0x{input_value:X}: expected 0x{expected_output:04X}, got 0x{stored_value:04X}")
         
         print(f"   ✓ Large value masking works")
+        
+        # Whole block in one write and one assertion
+        if not dmem.write_words(0x1000, inputs):
+            raise AssertionError("Block write should succeed")
+        stored_block = dmem.read_words(0x1000, len(inputs))
+        if stored_block != expected:
+            raise AssertionError(f"Block masking: expected {[hex(v) for v in expected]}, got {[hex(v) for v in stored_block]}")
+        
+        print(f"   ✓ Block write masking works")
         print(f"   ✓ 16-bit boundary enforcement works")
     
     def test_data_memory_clear_and_search(self):
@@ -323,6 +365,45 @@ class MemoryTests:
         print(f"   ✓ Memory clear works")
         print(f"   ✓ Search after clear works")
     
+    def test_data_memory_bulk_operations(self):
+        """Test bulk read_words/write_words για DataMemory"""
+        print("Testing DataMemory bulk operations...")
+        
+        dmem = DataMemory(size=16, base_address=0x1000)
+        
+        # Bulk write with masking
+        values = [0x1111, 0x2222, 0x12345, 0xFFFF]
+        if not dmem.write_words(0x1004, values):
+            raise AssertionError("Bulk write inside memory should succeed")
+        
+        expected = [value & 0xFFFF for value in values]
+        read_back = dmem.read_words(0x1004, len(values))
+        if read_back != expected:
+            raise AssertionError(f"Bulk read returned {read_back}, expected {expected}")
+        
+        # Single-word reads see the same data
+        if dmem.read_word(0x1006) != 0x2345:
+            raise AssertionError("Bulk-written word should be visible to read_word")
+        
+        # Blocks crossing the end of memory are rejected
+        if dmem.write_words(0x100E, [1, 2, 3]):
+            raise AssertionError("Bulk write past end of memory should fail")
+        
+        if dmem.read_words(0x100E, 3) != []:
+            raise AssertionError("Bulk read past end of memory should return []")
+        
+        if dmem.read_words(0x0FFF, 1) != []:
+            raise AssertionError("Bulk read below base address should return []")
+        
+        # Every word counts as one access
+        stats = dmem.get_statistics()
+        if stats['writes'] != 4 or stats['reads'] != 5:
+            raise AssertionError(f"Expected 4 writes / 5 reads, got {stats['writes']} / {stats['reads']}")
+        
+        print(f"   ✓ Bulk write/read works")
+        print(f"   ✓ Out-of-range blocks rejected")
+        print(f"   ✓ Per-word statistics tracked")
+    
     def test_memory_integration(self):
         """Test integration μεταξύ InstructionMemory και DataMemory"""
         print("Testing InstructionMemory and DataMemory integration...")
@@ -390,8 +471,12 @@ class MemoryTests:
         self.run_test("Data Memory Statistics", self.test_data_memory_statistics)
         self.run_test("Data Memory Value Masking", self.test_data_memory_value_masking)
         self.run_test("Data Memory Clear and Search", self.test_data_memory_clear_and_search)
+        self.run_test("Data Memory Bulk Operations", self.test_data_memory_bulk_operations)
         self.run_test("Memory Integration", self.test_memory_integration)
         
+        if self.quiet:
+            sys.stdout.write("\n".join(self.results) + "\n")
+        
         # Εμφάνιση αποτελεσμάτων
         print("\n" + "=" * 60)
         print("📊 TEST RESULTS")
@@ -426,6 +511,7 @@ def run_individual_test(test_name: str):
         'dmem_stats': tests.test_data_memory_statistics,
         'dmem_mask': tests.test_data_memory_value_masking,
         'dmem_clear': tests.test_data_memory_clear_and_search,
+        'dmem_bulk': tests.test_data_memory_bulk_operations,
         'integration': tests.test_memory_integration
     }
     
@@ -438,12 +524,17 @@ def run_individual_test(test_name: str):
 
 def main():
     """Κύρια συνάρτηση"""
-    if len(sys.argv) > 1:
-        test_name = sys.argv[1]
+    args = sys.argv[1:]
+    quiet = '--quiet' in args
+    if quiet:
+        args.remove('--quiet')
+    
+    if args:
+        test_name = args[0]
         run_individual_test(test_name)
     else:
         # Εκτέλεση όλων των tests
-        tests = MemoryTests()
+        tests = MemoryTests(quiet=quiet)
         success = tests.run_all_tests()
         
         # Exit code
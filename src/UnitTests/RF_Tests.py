@@ -11,50 +11,119 @@ Unit Tests για το RegisterFile
 - Test reset functionality
 """
 
+import io
 import sys
-from test_utils import add_src_to_path, configure_utf8_stdio
+import argparse
+import functools
+from contextlib import redirect_stdout
+try:
+    # Package mode (python -m src.UnitTests.RF_Tests): κανονικό import, χωρίς αλλαγή στο sys.path
+    from .test_utils import configure_utf8_stdio
+    from ..RegisterFile import RegisterFile, Register
+except ImportError:
+    # Script mode (python RF_Tests.py): προσθήκη του parent directory στο Python path
+    from test_utils import add_src_to_path, configure_utf8_stdio
+    add_src_to_path()
+    from RegisterFile import RegisterFile, Register
 
-# Προσθήκη του parent directory στο Python path
 configure_utf8_stdio()
-add_src_to_path()
 
-from RegisterFile import RegisterFile, Register
+# ABI names x0-x15: η μοναδική πηγή για όλα τα name test vectors
+ABI = ('zero', 'ra', 'sp', 'gp', 'tp', 't0', 't1', 't2',
+       's0', 's1', 'a0', 'a1', 'a2', 'a3', 'a4', 'a7')
+
+# (name, expected register number) ζεύγη, χτίζονται μία φορά στο import
+ABI_NAMES = tuple((name, i) for i, name in enumerate(ABI))
+X_NAMES = tuple((f'x{i}', i) for i in range(16))
+UPPER_NAMES = tuple((name.upper(), i) for name, i in ABI_NAMES + X_NAMES)
+INVALID_NAMES = tuple((name, -1) for name in ('x16', 'x20', 'invalid', 'xyz', ''))
+
+
+def find_name_mismatches(rf, name_pairs):
+    """
+    Επιστρέφει (name, expected, got) για κάθε όνομα που δεν αντιστοιχεί σωστά
+    """
+    lookup = rf.get_register_by_name
+    results = [(name, expected, lookup(name)) for name, expected in name_pairs]
+    return [result for result in results if result[1] != result[2]]
+
+
+def verify_masked_writes(rf, writes):
+    """
+    Γράφει (reg_num, value) ζεύγη και ελέγχει ότι κάθε read επιστρέφει value & 0xFFFF
+    
+    Returns:
+        list: (reg_num, value, stored) για κάθε αποτυχία (κενή αν όλα OK)
+    """
+    write, read = rf.write, rf.read
+    mismatches = []
+    for reg_num, value in writes:
+        write(reg_num, value)
+        stored = read(reg_num)
+        if stored != value & 0xFFFF:
+            mismatches.append((reg_num, value, stored))
+    return mismatches
 
 
 class RegisterFileTests:
     """Test suite για το RegisterFile"""
     
-    def __init__(self):
+    def __init__(self, verbose=False, fail_fast=False):
         self.test_count = 0
         self.passed_tests = 0
         self.failed_tests = 0
+        self.verbose = verbose   # Εμφάνιση λεπτομερειών και για επιτυχημένα tests
+        self._log = []           # Output του τρέχοντος test, γράφεται μία φορά
+        self.fail_fast = fail_fast   # Διακοπή του run_all_tests στο πρώτο failure
+        self._aborted = False
+        self._nested = False     # True για suite που τρέχει μέσα από το test_repeated_runs
+        self.rf = RegisterFile()  # Shared instance, reset πριν και μετά από κάθε test
+    
+    def fresh_register_file(self) -> RegisterFile:
+        """Επιστρέφει το shared RegisterFile μηδενισμένο"""
+        self.rf.reset_all()
+        return self.rf
+    
+    def log(self, message: str = ""):
+        """Κρατά μια γραμμή output του τρέχοντος test"""
+        self._log.append(message)
     
     def run_test(self, test_name: str, test_func):
         """Εκτελεί ένα test"""
         self.test_count += 1
-        print(f"\n🧪 Test {self.test_count}: {test_name}")
-        print("─" * 50)
+        self._log = []
         
         try:
             test_func()
             self.passed_tests += 1
-            print(f"✅ PASSED: {test_name}")
+            result = [f"✅ PASSED: {test_name}"]
+            show_details = self.verbose
         except Exception as e:
             self.failed_tests += 1
-            print(f"❌ FAILED: {test_name}")
-            print(f"   Error: {e}")
+            result = [f"❌ FAILED: {test_name}", f"   Error: {e}"]
+            show_details = True  # Οι λεπτομέρειες βοηθούν πάντα σε αποτυχία
+            self._aborted = self.fail_fast
+        finally:
+            self.rf.reset_all()  # Καμία διαρροή state στο επόμενο test
+        
+        if show_details:
+            header = [f"\n🧪 Test {self.test_count}: {test_name}", "─" * 50]
+            result = header + self._log + result
+        
+        # Ένα write ανά test αντί για ένα print ανά γραμμή
+        sys.stdout.write("\n".join(result) + "\n")
     
     def test_basic_read_write(self):
         """Test βασικών read/write operations"""
-        print("Testing basic read/write operations...")
+        self.log("Testing basic read/write operations...")
         
-        rf = RegisterFile()
+        rf = self.fresh_register_file()
         
-        # Test initial state (all zeros)
-        for i in range(16):
-            value = rf.read(i)
-            if value != 0:
-                raise AssertionError(f"Register x{i} should be 0 initially, got {value}")
+        # Test initial state (all zeros) - one comparison for all registers
+        read = rf.read
+        values = [read(i) for i in range(16)]
+        if any(values):
+            raise AssertionError(f"All registers should be 0 initially, got {values}")
         
         # Test writing to various registers
         test_values = [
@@ -75,15 +144,15 @@ class RegisterFileTests:
             if read_value != value:
                 raise AssertionError(f"x{reg_num}: Expected {value}, got {read_value}")
         
-        print(f"   ✓ Initial state correct (all zeros)")
-        print(f"   ✓ Write operations successful")
-        print(f"   ✓ Read operations return correct values")
+        self.log(f"   ✓ Initial state correct (all zeros)")
+        self.log(f"   ✓ Write operations successful")
+        self.log(f"   ✓ Read operations return correct values")
     
     def test_x0_protection(self):
         """Test x0 protection (hard-wired zero)"""
-        print("Testing x0 protection...")
+        self.log("Testing x0 protection...")
         
-        rf = RegisterFile()
+        rf = self.fresh_register_file()
         
         # Test that x0 is initially 0
         if rf.read(0) != 0:
@@ -107,58 +176,46 @@ class RegisterFileTests:
             if rf.read(0) != 0:
                 raise AssertionError(f"x0 should remain 0 after writing {value}")
         
-        print(f"   ✓ x0 is initially 0")
-        print(f"   ✓ Writing to x0 fails")
-        print(f"   ✓ x0 remains 0 after write attempts")
+        self.log(f"   ✓ x0 is initially 0")
+        self.log(f"   ✓ Writing to x0 fails")
+        self.log(f"   ✓ x0 remains 0 after write attempts")
     
     def test_abi_register_names(self):
         """Test ABI register names resolution"""
-        print("Testing ABI register names...")
+        self.log("Testing ABI register names...")
         
-        rf = RegisterFile()
+        rf = self.fresh_register_file()
         
         # Test ABI name mapping
-        abi_tests = [
-            ('zero', 0), ('ra', 1), ('sp', 2), ('gp', 3), ('tp', 4),
-            ('t0', 5), ('t1', 6), ('t2', 7), ('s0', 8), ('s1', 9),
-            ('a0', 10), ('a1', 11), ('a2', 12), ('a3', 13), ('a4', 14), ('a7', 15)
-        ]
-        
-        for abi_name, expected_reg_num in abi_tests:
-            reg_num = rf.get_register_by_name(abi_name)
-            if reg_num != expected_reg_num:
-                raise AssertionError(f"ABI '{abi_name}' should map to {expected_reg_num}, got {reg_num}")
+        mismatches = find_name_mismatches(rf, ABI_NAMES)
+        if mismatches:
+            raise AssertionError(f"ABI name mismatches (name, expected, got): {mismatches}")
         
         # Test x-style names
-        for i in range(16):
-            reg_num = rf.get_register_by_name(f'x{i}')
-            if reg_num != i:
-                raise AssertionError(f"'x{i}' should map to {i}, got {reg_num}")
+        mismatches = find_name_mismatches(rf, X_NAMES)
+        if mismatches:
+            raise AssertionError(f"x-style name mismatches (name, expected, got): {mismatches}")
         
         # Test case insensitivity
-        case_tests = [('RA', 1), ('SP', 2), ('A0', 10), ('X5', 5)]
-        for name, expected in case_tests:
-            reg_num = rf.get_register_by_name(name)
-            if reg_num != expected:
-                raise AssertionError(f"'{name}' should map to {expected}, got {reg_num}")
+        mismatches = find_name_mismatches(rf, UPPER_NAMES)
+        if mismatches:
+            raise AssertionError(f"Case-insensitive mismatches (name, expected, got): {mismatches}")
         
         # Test invalid names
-        invalid_names = ['x16', 'x20', 'invalid', 'xyz', '']
-        for name in invalid_names:
-            reg_num = rf.get_register_by_name(name)
-            if reg_num != -1:
-                raise AssertionError(f"Invalid name '{name}' should return -1, got {reg_num}")
-        
-        print(f"   ✓ ABI names map correctly")
-        print(f"   ✓ x-style names work")
-        print(f"   ✓ Case insensitive mapping works")
-        print(f"   ✓ Invalid names return -1")
+        mismatches = find_name_mismatches(rf, INVALID_NAMES)
+        if mismatches:
+            raise AssertionError(f"Invalid names should return -1 (name, expected, got): {mismatches}")
+        
+        self.log(f"   ✓ ABI names map correctly")
+        self.log(f"   ✓ x-style names work")
+        self.log(f"   ✓ Case insensitive mapping works")
+        self.log(f"   ✓ Invalid names return -1")
     
     def test_boundary_conditions(self):
         """Test boundary conditions"""
-        print("Testing boundary conditions...")
+        self.log("Testing boundary conditions...")
         
-        rf = RegisterFile()
+        rf = self.fresh_register_file()
         
         # Test invalid register numbers
         invalid_reads = [-1, 16, 20, 100]
@@ -173,14 +230,12 @@ class RegisterFileTests:
             if success:
                 raise AssertionError(f"Writing to invalid register {reg_num} should fail")
         
-        # Test 16-bit value masking
-        large_values = [0x10000, 0x12345, 0xFFFFF]
-        for value in large_values:
-            rf.write(5, value)  # Write to t0
-            read_value = rf.read(5)
-            expected = value & 0xFFFF
-            if read_value != expected:
-                raise AssertionError(f"Large value 0x{value:X} should be masked to 0x{expected:04X}, got 0x{read_value:04X}")
+        # Test 16-bit value masking (writes to t0)
+        inputs = (0x10000, 0x12345, 0xFFFFF, 0xFFFF, 0x0000)
+        mismatches = verify_masked_writes(rf, [(5, value) for value in inputs])
+        if mismatches:
+            raise AssertionError("Values should be masked to 16-bit (value, stored): "
+                                 f"{[(hex(value), hex(stored)) for _, value, stored in mismatches]}")
         
         # Test maximum and minimum values
         rf.write(10, 0xFFFF)  # Maximum 16-bit value
@@ -191,15 +246,15 @@ class RegisterFileTests:
         if rf.read(10) != 0x0000:
             raise AssertionError("Minimum value 0x0000 not stored correctly")
         
-        print(f"   ✓ Invalid register numbers handled correctly")
-        print(f"   ✓ Large values are properly masked to 16-bit")
-        print(f"   ✓ Maximum and minimum values work")
+        self.log(f"   ✓ Invalid register numbers handled correctly")
+        self.log(f"   ✓ Large values are properly masked to 16-bit")
+        self.log(f"   ✓ Maximum and minimum values work")
     
     def test_register_information(self):
         """Test register information retrieval"""
-        print("Testing register information...")
+        self.log("Testing register information...")
         
-        rf = RegisterFile()
+        rf = self.fresh_register_file()
         
         # Test valid register info
         expected_info = [
@@ -226,14 +281,14 @@ class RegisterFileTests:
             if name != "INVALID":
                 raise AssertionError(f"Invalid register {reg_num} should return 'INVALID' name")
         
-        print(f"   ✓ Valid register information correct")
-        print(f"   ✓ Invalid register information handled")
+        self.log(f"   ✓ Valid register information correct")
+        self.log(f"   ✓ Invalid register information handled")
     
     def test_reset_functionality(self):
         """Test reset functionality"""
-        print("Testing reset functionality...")
+        self.log("Testing reset functionality...")
         
-        rf = RegisterFile()
+        rf = self.fresh_register_file()
         
         # Write to several registers
         test_data = [(1, 100), (2, 200), (5, 0xFFFF), (10, 42), (15, 255)]
@@ -249,22 +304,22 @@ class RegisterFileTests:
         rf.reset_all()
         
         # Verify all registers are 0 (including x0)
-        for i in range(16):
-            value = rf.read(i)
-            if value != 0:
-                raise AssertionError(f"After reset, x{i} should be 0, got {value}")
+        read = rf.read
+        values = [read(i) for i in range(16)]
+        if any(values):
+            raise AssertionError(f"After reset, all registers should be 0, got {values}")
         
         # Test that x0 is still protected after reset
         success = rf.write(0, 123)
         if success:
             raise AssertionError("x0 should still be protected after reset")
         
-        print(f"   ✓ Reset clears all registers to 0")
-        print(f"   ✓ x0 protection maintained after reset")
+        self.log(f"   ✓ Reset clears all registers to 0")
+        self.log(f"   ✓ x0 protection maintained after reset")
     
     def test_individual_register(self):
         """Test individual Register class"""
-        print("Testing individual Register class...")
+        self.log("Testing individual Register class...")
         
         # Test normal register
         reg = Register("x1", "ra", "Return address", 0, False)
@@ -307,16 +362,16 @@ class RegisterFileTests:
         if ro_reg.read() != 0:
             raise AssertionError("Read-only register should remain 0 after reset")
         
-        print(f"   ✓ Normal register operations work")
-        print(f"   ✓ Read-only register protection works")
-        print(f"   ✓ 16-bit value masking works")
-        print(f"   ✓ Reset functionality works")
+        self.log(f"   ✓ Normal register operations work")
+        self.log(f"   ✓ Read-only register protection works")
+        self.log(f"   ✓ 16-bit value masking works")
+        self.log(f"   ✓ Reset functionality works")
     
     def test_edge_cases(self):
         """Test edge cases"""
-        print("Testing edge cases...")
+        self.log("Testing edge cases...")
         
-        rf = RegisterFile()
+        rf = self.fresh_register_file()
         
         # Test writing 0 to registers
         rf.write(5, 123)  # First write non-zero
@@ -326,39 +381,112 @@ class RegisterFileTests:
         
         # Test multiple writes to same register
         values = [1, 100, 0xFFFF, 42, 0]
-        for value in values:
-            rf.write(10, value)
-            if rf.read(10) != value:
-                raise AssertionError(f"Multiple writes failed at value {value}")
-        
-        # Test all registers simultaneously
-        for i in range(1, 16):  # Skip x0
-            rf.write(i, i * 100)
+        mismatches = verify_masked_writes(rf, [(10, value) for value in values])
+        if mismatches:
+            raise AssertionError(f"Multiple writes failed at value {mismatches[0][1]}")
+        
+        # Test all registers simultaneously (x1-x15): write all, then verify all
+        expected = [i * 100 for i in range(1, 16)]
+        write, read = rf.write, rf.read
+        for reg_num, value in enumerate(expected, start=1):
+            write(reg_num, value)
+        
+        actual = [read(reg_num) for reg_num in range(1, 16)]
+        if actual != expected:
+            raise AssertionError(f"Simultaneous write test failed: expected {expected}, got {actual}")
+        
+        self.log(f"   ✓ Writing 0 works correctly")
+        self.log(f"   ✓ Multiple writes to same register work")
+        self.log(f"   ✓ All registers can be written simultaneously")
+    
+    def test_bulk_read(self):
+        """Test bulk register reads (read_all)"""
+        self.log("Testing bulk register reads...")
         
+        rf = self.fresh_register_file()
         for i in range(1, 16):
-            expected = i * 100
-            if rf.read(i) != expected:
-                raise AssertionError(f"Simultaneous write test failed for x{i}")
+            rf.write(i, i * 0x111)
+        
+        expected = [i * 0x111 for i in range(16)]
         
-        print(f"   ✓ Writing 0 works correctly")
-        print(f"   ✓ Multiple writes to same register work")
-        print(f"   ✓ All registers can be written simultaneously")
+        values = rf.read_all()
+        if values != expected:
+            raise AssertionError(f"read_all mismatch: {values}")
+        
+        # Νέο list σε κάθε κλήση: οι callers (monitor snapshots, register panel) το κρατούν
+        if rf.read_all() is values:
+            raise AssertionError("read_all should return a new list on every call")
+        
+        values[1] = 0
+        if rf.read(1) != 0x111:
+            raise AssertionError("Modifying the read_all list should not change the registers")
+        
+        self.log(f"   ✓ read_all returns all register values")
+        self.log(f"   ✓ Each call returns an independent list")
+    
+    def test_repeated_runs(self):
+        """Test ότι το run_all_tests ξεκινά από μηδέν σε κάθε run"""
+        self.log("Testing repeated suite runs...")
+        
+        suite = RegisterFileTests()
+        suite._nested = True  # Χωρίς αυτό το test στο inner suite (αποφυγή αναδρομής)
+        expected = (len(suite.unit_tests()), len(suite.unit_tests()), 0)
+        
+        for run in (1, 2):
+            with redirect_stdout(io.StringIO()):
+                success = suite.run_all_tests()
+            counts = (suite.test_count, suite.passed_tests, suite.failed_tests)
+            if not success or counts != expected:
+                raise AssertionError(f"Run {run}: (total, passed, failed) should be {expected}, got {counts}")
+        
+        self.log(f"   ✓ Counters reset between runs of the same suite")
     
-    def run_all_tests(self):
-        """Εκτελεί όλα τα tests"""
+    def unit_tests(self):
+        """Επιστρέφει τα (όνομα, method) των RegisterFile unit tests"""
+        return [
+            ("Basic Read/Write", self.test_basic_read_write),
+            ("x0 Protection", self.test_x0_protection),
+            ("ABI Register Names", self.test_abi_register_names),
+            ("Boundary Conditions", self.test_boundary_conditions),
+            ("Register Information", self.test_register_information),
+            ("Reset Functionality", self.test_reset_functionality),
+            ("Individual Register", self.test_individual_register),
+            ("Edge Cases", self.test_edge_cases),
+            ("Bulk Read", self.test_bulk_read)
+        ]
+    
+    def run_all_tests(self, fail_fast: bool = None):
+        """
+        Εκτελεί όλα τα tests
+        
+        Args:
+            fail_fast (bool): Διακοπή στο πρώτο failure (None: χρήση του self.fail_fast)
+        """
+        if fail_fast is not None:
+            self.fail_fast = fail_fast
+        self._aborted = False
+        
+        # Το suite μπορεί να ξανατρέξει (κοινό instance από το _suite): μηδενισμός counters
+        self.test_count = 0
+        self.passed_tests = 0
+        self.failed_tests = 0
+        self._log = []
+        
         print("=" * 60)
         print("🧪 REGISTER FILE UNIT TESTS")
         print("=" * 60)
         
         # Εκτέλεση όλων των tests
-        self.run_test("Basic Read/Write", self.test_basic_read_write)
-        self.run_test("x0 Protection", self.test_x0_protection)
-        self.run_test("ABI Register Names", self.test_abi_register_names)
-        self.run_test("Boundary Conditions", self.test_boundary_conditions)
-        self.run_test("Register Information", self.test_register_information)
-        self.run_test("Reset Functionality", self.test_reset_functionality)
-        self.run_test("Individual Register", self.test_individual_register)
-        self.run_test("Edge Cases", self.test_edge_cases)
+        tests = self.unit_tests()
+        if not self._nested:
+            tests.append(("Repeated Runs", self.test_repeated_runs))
+        
+        for test_name, test_func in tests:
+            self.run_test(test_name, test_func)
+            if self._aborted:
+                skipped = len(tests) - self.test_count
+                print(f"\n⏹️  Fail-fast: stopped after first failure ({skipped} tests skipped)")
+                break
         
         # Εμφάνιση αποτελεσμάτων
         print("\n" + "=" * 60)
@@ -380,9 +508,15 @@ class RegisterFileTests:
         return self.failed_tests == 0
 
 
-def run_individual_test(test_name: str):
-    """Εκτελεί ένα συγκεκριμένο test"""
-    tests = RegisterFileTests()
+@functools.lru_cache(maxsize=2)
+def _suite(verbose: bool = False) -> RegisterFileTests:
+    """Επιστρέφει ένα κοινό RegisterFileTests instance (ένα ανά verbose mode)"""
+    return RegisterFileTests(verbose=verbose)
+
+
+def run_individual_test(test_name: str, verbose: bool = False, repeat: int = 1):
+    """Εκτελεί ένα συγκεκριμένο test (repeat φορές, με το ίδιο suite)"""
+    tests = _suite(verbose)
     
     test_methods = {
         'basic': tests.test_basic_read_write,
@@ -392,11 +526,15 @@ def run_individual_test(test_name: str):
         'info': tests.test_register_information,
         'reset': tests.test_reset_functionality,
         'register': tests.test_individual_register,
-        'edge': tests.test_edge_cases
+        'edge': tests.test_edge_cases,
+        'bulk': tests.test_bulk_read,
+        'repeat': tests.test_repeated_runs
     }
     
     if test_name.lower() in test_methods:
-        tests.run_test(test_name.capitalize(), test_methods[test_name.lower()])
+        test_func = test_methods[test_name.lower()]
+        for _ in range(repeat):
+            tests.run_test(test_name.capitalize(), test_func)
     else:
         print(f"❌ Unknown test: {test_name}")
         print("Available tests:", list(test_methods.keys()))
@@ -404,13 +542,22 @@ def run_individual_test(test_name: str):
 
 def main():
     """Κύρια συνάρτηση"""
-    if len(sys.argv) > 1:
-        test_name = sys.argv[1]
-        run_individual_test(test_name)
+    parser = argparse.ArgumentParser(description="RegisterFile unit tests")
+    parser.add_argument('test', nargs='?', help="Όνομα test (π.χ. basic, abi, edge)")
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help="Εμφάνιση λεπτομερειών και για επιτυχημένα tests")
+    parser.add_argument('--repeat', type=int, default=1, metavar='N',
+                        help="Εκτέλεση του επιλεγμένου test N φορές")
+    parser.add_argument('--fail-fast', action='store_true',
+                        help="Διακοπή στο πρώτο failure")
+    args = parser.parse_args()
+    
+    if args.test:
+        run_individual_test(args.test, args.verbose, args.repeat)
     else:
         # Εκτέλεση όλων των tests
-        tests = RegisterFileTests()
-        success = tests.run_all_tests()
+        tests = _suite(args.verbose)
+        success = tests.run_all_tests(fail_fast=args.fail_fast)
         
         # Exit code
         sys.exit(0 if success else 1)
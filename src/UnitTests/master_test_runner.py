@@ -14,11 +14,17 @@ Comprehensive testing για το διαστημικό RISC-V simulator system:
 
 import os
 
+import io
 import sys
 import time
 import random
-import tempfile
-from typing import List, Dict, Any
+import operator
+import functools
+import itertools
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from typing import List, Dict, Any, Tuple
 from test_utils import add_src_to_path, configure_utf8_stdio
 
 # Import όλων των components
@@ -32,6 +38,133 @@ from ALU import ALU
 from ExceptionHandling import ProcessorErrorHandler
 
 
+# Αναμενόμενη τελική μνήμη του advanced memory test: (address, value)
+_EXPECTED_MEM = (
+    (0x1000, 15),  # mem[0] = 15
+    (0x1001, 10),  # mem[1] = 10
+    (0x1002, 5),   # mem[2] = 5
+    (0x1003, 25),  # mem[3] = 25
+    (0x1004, 30)   # mem[4] = 30
+)
+
+# Αναμενόμενα αποτελέσματα edge cases: (results key, expected, label)
+_EDGE_EXPECTED = (
+    ('max_values', 30, "Max values test"),       # 15 + 15
+    ('zero_ops', 0, "Zero operations test"),
+    ('self_ref', 20, "Self-reference test"),     # 5 + 5 + 10
+    ('boundary', 15, "Boundary test")
+)
+
+
+# Large program για stress testing (ένα join πάνω σε generators)
+_STRESS_PROGRAM = "\n".join(itertools.chain(
+    ("# Stress test program", "main:"),
+    (f"    addi x{(i % 15) + 1}, x0, {i % 16}" for i in range(20)),
+    (f"    add x{((i + 2) % 15) + 1}, x{(i % 15) + 1}, x{((i + 1) % 15) + 1}" for i in range(15)),
+    (f"    sw x{(i % 15) + 1}, {i}(x0)" for i in range(10)),
+    (f"    lw x{((i + 5) % 15) + 1}, {i}(x0)" for i in range(10)),
+    ("    halt",)
+))
+
+# Programs για το run() vs run_compiled() equivalence test: (label, program, max_cycles)
+# Assembly source (str) ή raw machine code (array) για invalid words / χωρίς HALT
+_EQUIVALENCE_PROGRAMS = (
+    ("stress", _STRESS_PROGRAM, 200),
+    ("branch loop", """
+        main:
+            addi x1, x0, 7
+            addi x2, x0, 3
+        loop:
+            add x3, x3, x2
+            addi x1, x1, -1
+            bne x1, x0, loop
+            sw x3, 0(x0)
+            lw x4, 0(x0)
+            halt
+        """, 100),
+    ("invalid word", array('H', [0x510A, 0x5205, 0x0312, 0xE123, 0x520B, 0xF000]), 20),
+    ("no halt", array('H', [0x510A, 0x5205, 0x0312, 0x9300]), 20),
+    ("max cycles", """
+        main:
+            addi x1, x1, 1
+            beq x0, x0, main
+        """, 25)
+)
+
+
+def _processor_state(processor: RiscVProcessor) -> Dict[str, Any]:
+    """Snapshot του ορατού state ενός processor μετά από run (για σύγκριση)"""
+    return {
+        'registers': processor.register_file.read_all(),
+        'memory': processor.data_memory.memory.tolist(),
+        'memory_stats': processor.data_memory.get_statistics(),
+        'stats': dict(processor.stats),
+        'execution_history': [dict(entry) for entry in processor.execution_history],
+        'pc': processor.pc,
+        'cycle_count': processor.cycle_count,
+        'instruction_count': processor.instruction_count,
+        'halted': processor.halted
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_assembler() -> RiscVAssembler:
+    """Ένας κοινός assembler (κάθε assemble κάνει reset labels/state)"""
+    return RiscVAssembler()
+
+
+@functools.lru_cache(maxsize=None)
+def _assemble_cached(source: str) -> Tuple[int, ...]:
+    """
+    Κάνει assemble ένα πρόγραμμα μία φορά ανά source string
+    
+    Args:
+        source (str): Assembly κώδικας
+        
+    Returns:
+        Tuple[int, ...]: Immutable machine code (το cache είναι κοινό για όλα τα tests)
+    """
+    return tuple(_shared_assembler().assemble_source(source))
+
+
+def _timed_call(test_func):
+    """
+    Εκτελεί ένα test function με timing
+    
+    Returns:
+        tuple: (result, error message ή None, execution time σε nanoseconds)
+    """
+    start_ns = time.perf_counter_ns()  # Monotonic, high-resolution
+    try:
+        result = test_func()
+        error = None
+    except Exception as e:
+        result = None
+        error = str(e)
+    return result, error, time.perf_counter_ns() - start_ns
+
+
+_worker_suite = None  # Ένα suite instance ανά worker process
+
+
+def _run_in_worker(method_name: str):
+    """
+    Worker για parallel mode: εκτελεί ένα test σε ξεχωριστό process
+    
+    Returns:
+        tuple: (result, error, execution time, captured output)
+    """
+    global _worker_suite
+    if _worker_suite is None:
+        with redirect_stdout(io.StringIO()):  # Χωρίς banner από τους workers
+            _worker_suite = UltimateTestSuite()
+    
+    output = io.StringIO()
+    with redirect_stdout(output):
+        result, error, execution_ns = _timed_call(getattr(_worker_suite, method_name))
+    return result, error, execution_ns, output.getvalue()
+
+
 class UltimateTestSuite:
     """Ultimate test suite για το RISC-V simulator"""
     
@@ -39,39 +172,50 @@ class UltimateTestSuite:
         self.test_count = 0
         self.passed_tests = 0
         self.failed_tests = 0
-        self.performance_data = {}
+        self.performance_data = {}  # test name → execution time (ns)
+        
+        # Λεπτομέρειες "   ✓ ..." μόνο με SUITE_VERBOSE=1 (τα PASSED/FAILED πάντα)
+        self.verbose = os.environ.get("SUITE_VERBOSE", "0") == "1"
         
         print("🚀 ULTIMATE RISC-V SIMULATOR TEST SUITE")
         print("="*60)
         print("Testing: Memory, Monitoring, Exceptions, Logs, Performance")
         print("="*60)
     
-    def run_test(self, test_name: str, test_func):
-        """Εκτελεί ένα test με timing"""
+    # (results key, test name, method name) με τη σειρά εκτέλεσης
+    TESTS = [
+        ('memory', "Advanced Memory Operations", 'test_memory_operations_advanced'),
+        ('exceptions', "Exception Handling", 'test_exception_handling_comprehensive'),
+        ('debugging', "Logging & Debugging", 'test_logging_and_debugging'),
+        ('performance', "Performance Stress Test", 'test_performance_stress'),
+        ('edge_cases', "Edge Cases", 'test_edge_cases_comprehensive'),
+        ('compiled', "Compiled Dispatch Equivalence", 'test_compiled_equivalence'),
+        ('workflow', "Complete Workflow", 'test_complete_workflow')
+    ]
+    
+    def _begin_test(self, test_name: str):
+        """Τυπώνει το header ενός test"""
         self.test_count += 1
         print(f"\n🧪 Test {self.test_count}: {test_name}")
         print("─" * 50)
-        
-        start_time = time.time()
-        try:
-            result = test_func()
-            end_time = time.time()
-            
+    
+    def _record_result(self, test_name: str, result, error, execution_ns: int):
+        """Καταγράφει και τυπώνει το αποτέλεσμα ενός test"""
+        if error is None:
             self.passed_tests += 1
-            execution_time = end_time - start_time
-            self.performance_data[test_name] = execution_time
-            
-            print(f"✅ PASSED: {test_name} ({execution_time:.3f}s)")
+            self.performance_data[test_name] = execution_ns
+            print(f"✅ PASSED: {test_name} ({execution_ns / 1e9:.3f}s)")
             return result
-            
-        except Exception as e:
-            end_time = time.time()
-            self.failed_tests += 1
-            execution_time = end_time - start_time
-            
-            print(f"❌ FAILED: {test_name} ({execution_time:.3f}s)")
-            print(f"   Error: {e}")
-            return None
+        
+        self.failed_tests += 1
+        print(f"❌ FAILED: {test_name} ({execution_ns / 1e9:.3f}s)")
+        print(f"   Error: {error}")
+        return None
+    
+    def run_test(self, test_name: str, test_func):
+        """Εκτελεί ένα test με timing"""
+        self._begin_test(test_name)
+        return self._record_result(test_name, *_timed_call(test_func))
     
     def test_memory_operations_advanced(self):
         """Advanced memory testing με monitoring"""
@@ -113,58 +257,46 @@ class UltimateTestSuite:
         """
         
         # Assemble και load
-        assembler = RiscVAssembler()
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.asm', delete=False) as f:
-            f.write(memory_program)
-            temp_file = f.name
-        
-        try:
-            machine_code = assembler.assemble_file(temp_file)
-            processor.load_program_direct(machine_code)
-            
-            # Execute with monitoring
-            success = processor.run(max_cycles=50)
-            if not success:
-                raise AssertionError("Program execution failed")
-            
-            # Verify memory state
-            expected_memory = {
-                0x1000: 15,  # mem[0] = 15
-                0x1001: 10,  # mem[1] = 10
-                0x1002: 5,   # mem[2] = 5
-                0x1003: 25,  # mem[3] = 25
-                0x1004: 30   # mem[4] = 30
-            }
-
-            stats = processor.data_memory.get_statistics()
-            
-            for addr, expected in expected_memory.items():
-                actual = processor.data_memory.memory[addr - processor.data_memory.base_address]
+        machine_code = list(_assemble_cached(memory_program))
+        processor.load_program_direct(machine_code)
+        
+        # Execute with monitoring
+        success = processor.run(max_cycles=50)
+        if not success:
+            raise AssertionError("Program execution failed")
+        
+        # Verify memory state
+        stats = processor.data_memory.get_statistics()
+        
+        # Ένα block read για όλες τις διευθύνσεις (μετά το stats snapshot)
+        expected_values = [expected for _, expected in _EXPECTED_MEM]
+        actual_values = processor.data_memory.read_words(_EXPECTED_MEM[0][0], len(_EXPECTED_MEM))
+        if actual_values != expected_values:
+            for (addr, expected), actual in zip(_EXPECTED_MEM, actual_values):
                 if actual != expected:
                     raise AssertionError(f"Memory[0x{addr:04X}]: expected {expected}, got {actual}")
-            
-            # Check memory statistics
-            expected_reads = 4  # 4 LW instructions
-            expected_writes = 5  # 5 SW instructions
-            
-            if stats['reads'] != expected_reads:
-                raise AssertionError(f"Expected {expected_reads} reads, got {stats['reads']}")
-            
-            if stats['writes'] != expected_writes:
-                raise AssertionError(f"Expected {expected_writes} writes, got {stats['writes']}")
-            
+            raise AssertionError(f"Memory block: expected {expected_values}, got {actual_values}")
+        
+        # Check memory statistics
+        expected_reads = 4  # 4 LW instructions
+        expected_writes = 5  # 5 SW instructions
+        
+        if stats['reads'] != expected_reads:
+            raise AssertionError(f"Expected {expected_reads} reads, got {stats['reads']}")
+        
+        if stats['writes'] != expected_writes:
+            raise AssertionError(f"Expected {expected_writes} writes, got {stats['writes']}")
+        
+        if self.verbose:
             print(f"   ✓ Complex memory operations work")
             print(f"   ✓ Memory statistics: {stats['reads']} reads, {stats['writes']} writes")
             print(f"   ✓ Final memory state verified")
-            
-            return {
-                'cycles': processor.cycle_count,
-                'memory_ops': stats['total_accesses'],
-                'final_result': processor.register_file.read(9)
-            }
-            
-        finally:
-            os.unlink(temp_file)
+        
+        return {
+            'cycles': processor.cycle_count,
+            'memory_ops': stats['total_accesses'],
+            'final_result': processor.register_file.read(9)
+        }
     
     def test_exception_handling_comprehensive(self):
         """Comprehensive exception handling testing"""
@@ -175,14 +307,14 @@ class UltimateTestSuite:
         processor = RiscVProcessor(32, 32)
         
         # Program with potential errors
-        error_program = [
+        error_program = array('H', [
             0x510A,  # ADDI x1, x0, 10  (valid)
             0x5205,  # ADDI x2, x0, 5   (valid)
             0x0312,  # ADD x3, x1, x2   (valid)
             0xE123,  # Invalid instruction
             0x520B,  # ADDI x2, x0, 11  (valid - should continue)
             0xF000   # HALT
-        ]
+        ])
         
         processor.load_program_direct(error_program)
         
@@ -199,9 +331,10 @@ class UltimateTestSuite:
         if x2_value != 11:  # Last ADDI should have executed
             raise AssertionError(f"x2 should be 11, got {x2_value}")
         
-        print(f"   ✓ Graceful error recovery works")
-        print(f"   ✓ Execution continued after invalid instruction")
-        print(f"   ✓ Final state is correct")
+        if self.verbose:
+            print(f"   ✓ Graceful error recovery works")
+            print(f"   ✓ Execution continued after invalid instruction")
+            print(f"   ✓ Final state is correct")
         
         return {
             'completed': processor.halted,
@@ -234,149 +367,105 @@ class UltimateTestSuite:
         """
         
         # Assemble και execute
-        assembler = RiscVAssembler()
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.asm', delete=False) as f:
-            f.write(debug_program)
-            temp_file = f.name
-        
-        try:
-            machine_code = assembler.assemble_file(temp_file)
-            processor.load_program_direct(machine_code)
+        machine_code = list(_assemble_cached(debug_program))
+        processor.load_program_direct(machine_code)
+        
+        # Execute step by step για debugging
+        max_steps = 50
+        step_count = 0
+        
+        # Analysis totals, υπολογίζονται στο ίδιο pass με την εκτέλεση
+        total_register_changes = 0
+        branch_instructions = 0
+        
+        # Bound methods μία φορά έξω από το loop (λιγότερα attribute lookups ανά step)
+        step = processor.step
+        read_all = processor.register_file.read_all
+        ne = operator.ne
+        
+        while not processor.halted and step_count < max_steps:
+            old_pc = processor.pc
+            old_registers = read_all()
             
-            # Execute step by step για debugging
-            step_count = 0
-            execution_trace = []
+            continuing = step()
             
-            while not processor.halted and step_count < 50:
-                old_pc = processor.pc
-                old_registers = [processor.register_file.read(i) for i in range(16)]
-                
-                continuing = processor.step()
-                
-                # Record execution trace
-                new_registers = [processor.register_file.read(i) for i in range(16)]
-                changed_registers = []
-                for i in range(16):
-                    if old_registers[i] != new_registers[i]:
-                        changed_registers.append((i, old_registers[i], new_registers[i]))
-                
-                trace_entry = {
-                    'step': step_count,
-                    'pc': old_pc,
-                    'new_pc': processor.pc,
-                    'changed_registers': changed_registers,
-                    'halted': processor.halted
-                }
-                execution_trace.append(trace_entry)
-                
-                step_count += 1
-                if not continuing:
-                    break
+            # Diff των δύο snapshots σε ένα pass
+            new_registers = read_all()
+            new_pc = processor.pc
+            halted = processor.halted
+            changes = sum(map(ne, old_registers, new_registers))
             
-            # Analyze execution trace
-            total_register_changes = sum(len(entry['changed_registers']) for entry in execution_trace)
-            branch_instructions = sum(1 for entry in execution_trace if entry['pc'] + 1 != entry['new_pc'] and not entry['halted'])
+            total_register_changes += changes
+            if old_pc + 1 != new_pc and not halted:
+                branch_instructions += 1
             
+            step_count += 1
+            if not continuing:
+                break
+        
+        if self.verbose:
             print(f"   ✓ Step-by-step execution completed in {step_count} steps")
             print(f"   ✓ Total register changes: {total_register_changes}")
             print(f"   ✓ Branch instructions executed: {branch_instructions}")
-            print(f"   ✓ Execution trace captured successfully")
-            
-            # Verify final result
-            final_result = processor.data_memory.read_word(0x1000)
-            # Expected: x3 should accumulate x2 (3) seven times = 21
-            expected_result = 7 * 3
+            print(f"   ✓ Step trace analysed while executing")
+        
+        # Verify final result
+        final_result = processor.data_memory.read_word(0x1000)
+        # Expected: x3 should accumulate x2 (3) seven times = 21
+        expected_result = 7 * 3
 
-            if not processor.halted:
-                raise AssertionError("Debug loop should halt before max step count")
+        if not processor.halted:
+            raise AssertionError("Debug loop should halt before max step count")
 
-            if final_result != expected_result:
-                raise AssertionError(f"Expected final result {expected_result}, got {final_result}")
-            
-            return {
-                'steps': step_count,
-                'register_changes': total_register_changes,
-                'branches': branch_instructions,
-                'final_result': final_result,
-                'trace_length': len(execution_trace)
-            }
-            
-        finally:
-            os.unlink(temp_file)
+        if final_result != expected_result:
+            raise AssertionError(f"Expected final result {expected_result}, got {final_result}")
+        
+        return {
+            'steps': step_count,
+            'register_changes': total_register_changes,
+            'branches': branch_instructions,
+            'final_result': final_result,
+            'trace_length': step_count  # Ένα step ανά trace entry (το trace δεν αποθηκεύεται)
+        }
     
     def test_performance_stress(self):
         """Performance stress testing"""
         print("Testing performance under stress conditions...")
         
-        # Large program για stress testing
-        stress_program_lines = [
-            "# Stress test program",
-            "main:"
-        ]
-        
-        # Generate many instructions
-        for i in range(20):
-            stress_program_lines.append(f"    addi x{(i % 15) + 1}, x0, {i % 16}")
-        
-        for i in range(15):
-            reg1 = (i % 15) + 1
-            reg2 = ((i + 1) % 15) + 1
-            reg3 = ((i + 2) % 15) + 1
-            stress_program_lines.append(f"    add x{reg3}, x{reg1}, x{reg2}")
+        # Execute και measure performance
+        processor = RiscVProcessor(128, 128)
         
-        for i in range(10):
-            reg = (i % 15) + 1
-            stress_program_lines.append(f"    sw x{reg}, {i}(x0)")
+        # Assembly timing
+        assembly_start = time.perf_counter()
+        machine_code = array('H', _assemble_cached(_STRESS_PROGRAM))
+        assembly_time = time.perf_counter() - assembly_start
         
-        for i in range(10):
-            reg = ((i + 5) % 15) + 1
-            stress_program_lines.append(f"    lw x{reg}, {i}(x0)")
+        # Execution timing
+        processor.load_program_direct(machine_code)
+        execution_start = time.perf_counter()
+        success = processor.run(max_cycles=200)
+        execution_time = time.perf_counter() - execution_start
         
-        stress_program_lines.append("    halt")
-        stress_program = "\n".join(stress_program_lines)
+        if not success:
+            raise AssertionError("Stress test execution failed")
         
-        # Execute και measure performance
-        processor = RiscVProcessor(128, 128)
-        assembler = RiscVAssembler()
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.asm', delete=False) as f:
-            f.write(stress_program)
-            temp_file = f.name
+        # Performance metrics
+        instructions_per_second = len(machine_code) / execution_time if execution_time > 0 else 0
+        cycles_per_second = processor.cycle_count / execution_time if execution_time > 0 else 0
         
-        try:
-            # Assembly timing
-            assembly_start = time.time()
-            machine_code = assembler.assemble_file(temp_file)
-            assembly_time = time.time() - assembly_start
-            
-            # Execution timing
-            processor.load_program_direct(machine_code)
-            execution_start = time.time()
-            success = processor.run(max_cycles=200)
-            execution_time = time.time() - execution_start
-            
-            if not success:
-                raise AssertionError("Stress test execution failed")
-            
-            # Performance metrics
-            instructions_per_second = len(machine_code) / execution_time if execution_time > 0 else 0
-            cycles_per_second = processor.cycle_count / execution_time if execution_time > 0 else 0
-            
+        if self.verbose:
             print(f"   ✓ Stress test completed: {len(machine_code)} instructions")
             print(f"   ✓ Assembly time: {assembly_time:.3f}s")
             print(f"   ✓ Execution time: {execution_time:.3f}s")
             print(f"   ✓ Performance: {instructions_per_second:.0f} inst/s, {cycles_per_second:.0f} cycles/s")
-            
-            return {
-                'instructions': len(machine_code),
-                'cycles': processor.cycle_count,
-                'assembly_time': assembly_time,
-                'execution_time': execution_time,
-                'inst_per_sec': instructions_per_second
-            }
-            
-        finally:
-            os.unlink(temp_file)
+        
+        return {
+            'instructions': len(machine_code),
+            'cycles': processor.cycle_count,
+            'assembly_time': assembly_time,
+            'execution_time': execution_time,
+            'inst_per_sec': instructions_per_second
+        }
     
     def test_edge_cases_comprehensive(self):
         """Comprehensive edge case testing"""
@@ -384,75 +473,97 @@ class UltimateTestSuite:
         
         results = {}
         
+        # Ένας processor για όλα τα sub-tests, με reset ανάμεσά τους
+        processor = RiscVProcessor(16, 16)
+        
         # Test 1: Maximum values
-        processor1 = RiscVProcessor(16, 16)
-        max_test = [
+        max_test = array('H', [
             0x510F,  # ADDI x1, x0, 15 (max 4-bit immediate)
             0x520F,  # ADDI x2, x0, 15
             0x0312,  # ADD x3, x1, x2 (15 + 15 = 30, but might overflow in some contexts)
             0xF000   # HALT
-        ]
-        processor1.load_program_direct(max_test)
-        processor1.run(10)
-        results['max_values'] = processor1.register_file.read(3)
+        ])
+        processor.load_program_direct(max_test)
+        processor.run(10)
+        results['max_values'] = processor.register_file.read(3)
         
         # Test 2: Zero operations
-        processor2 = RiscVProcessor(16, 16)
-        zero_test = [
+        processor.reset()
+        zero_test = array('H', [
             0x5100,  # ADDI x1, x0, 0
             0x0112,  # ADD x1, x1, x2 (0 + 0 = 0)
             0x9100,  # SW x1, 0(x0) (store 0)
             0x8200,  # LW x2, 0(x0) (load 0)
             0xF000   # HALT
-        ]
-        processor2.load_program_direct(zero_test)
-        processor2.run(10)
-        results['zero_ops'] = processor2.register_file.read(2)
+        ])
+        processor.load_program_direct(zero_test)
+        processor.run(10)
+        results['zero_ops'] = processor.register_file.read(2)
         
         # Test 3: Self-referencing operations
-        processor3 = RiscVProcessor(16, 16)
-        self_ref_test = [
+        processor.reset()
+        self_ref_test = array('H', [
             0x5105,  # ADDI x1, x0, 5
             0x0111,  # ADD x1, x1, x1 (x1 = x1 + x1 = 10)
             0x0111,  # ADD x1, x1, x1 (x1 = x1 + x1 = 20, but 16-bit limit)
             0xF000   # HALT
-        ]
-        processor3.load_program_direct(self_ref_test)
-        processor3.run(10)
-        results['self_ref'] = processor3.register_file.read(1)
+        ])
+        processor.load_program_direct(self_ref_test)
+        processor.run(10)
+        results['self_ref'] = processor.register_file.read(1)
         
         # Test 4: Memory boundary testing
-        processor4 = RiscVProcessor(16, 16)
-        boundary_test = [
+        processor.reset()
+        boundary_test = array('H', [
             0x510F,  # ADDI x1, x0, 15
             0x910F,  # SW x1, 15(x0) (store at edge of valid range)
             0x820F,  # LW x2, 15(x0) (load from edge)
             0xF000   # HALT
-        ]
-        processor4.load_program_direct(boundary_test)
-        processor4.run(10)
-        results['boundary'] = processor4.register_file.read(2)
+        ])
+        processor.load_program_direct(boundary_test)
+        processor.run(10)
+        results['boundary'] = processor.register_file.read(2)
         
         # Verify edge case results
-        if results['max_values'] != 30:  # 15 + 15
-            raise AssertionError(f"Max values test: expected 30, got {results['max_values']}")
+        for key, expected, label in _EDGE_EXPECTED:
+            if results[key] != expected:
+                raise AssertionError(f"{label}: expected {expected}, got {results[key]}")
         
-        if results['zero_ops'] != 0:
-            raise AssertionError(f"Zero operations test: expected 0, got {results['zero_ops']}")
-        
-        if results['self_ref'] != 20:  # 5 + 5 + 10
-            raise AssertionError(f"Self-reference test: expected 20, got {results['self_ref']}")
-        
-        if results['boundary'] != 15:
-            raise AssertionError(f"Boundary test: expected 15, got {results['boundary']}")
-        
-        print(f"   ✓ Maximum value operations work")
-        print(f"   ✓ Zero operations work correctly")
-        print(f"   ✓ Self-referencing operations work")
-        print(f"   ✓ Memory boundary operations work")
+        if self.verbose:
+            print(f"   ✓ Maximum value operations work")
+            print(f"   ✓ Zero operations work correctly")
+            print(f"   ✓ Self-referencing operations work")
+            print(f"   ✓ Memory boundary operations work")
         
         return results
     
+    def test_compiled_equivalence(self):
+        """Test ότι το run_compiled() αφήνει ίδιο state με το run()"""
+        print("Testing pre-decoded execution against run()...")
+        
+        for label, program, max_cycles in _EQUIVALENCE_PROGRAMS:
+            outcomes = []
+            for compiled in (False, True):
+                with redirect_stdout(io.StringIO()):  # Χωρίς assembler/per-instruction output
+                    if isinstance(program, str):
+                        program = array('H', _assemble_cached(program))
+                    processor = RiscVProcessor(64, 64)
+                    processor.load_program_direct(program)
+                    success = processor.run_compiled(max_cycles) if compiled else processor.run(max_cycles)
+                outcomes.append((success, _processor_state(processor)))
+            
+            (expected_success, expected), (actual_success, actual) = outcomes
+            if actual_success != expected_success:
+                raise AssertionError(f"{label}: run_compiled returned {actual_success}, run returned {expected_success}")
+            for key, value in expected.items():
+                if actual[key] != value:
+                    raise AssertionError(f"{label}: {key} differs (run: {value}, run_compiled: {actual[key]})")
+            
+            if self.verbose:
+                print(f"   ✓ {label}: identical state after {expected['cycle_count']} cycles")
+        
+        return {'programs': len(_EQUIVALENCE_PROGRAMS)}
+    
     def test_complete_workflow(self):
         """Test end-to-end assembly, execution, and memory verification."""
         print("Testing complete workflow...")
@@ -470,48 +581,54 @@ class UltimateTestSuite:
             halt
         """
 
-        assembler = RiscVAssembler()
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.asm', delete=False) as f:
-            f.write(workflow_program)
-            temp_file = f.name
+        machine_code = list(_assemble_cached(workflow_program))
+        if not machine_code:
+            raise AssertionError("Workflow assembly failed")
 
-        try:
-            machine_code = assembler.assemble_file(temp_file)
-            if not machine_code:
-                raise AssertionError("Workflow assembly failed")
+        processor.load_program_direct(machine_code)
+        success = processor.run(max_cycles=50)
+        if not success:
+            raise AssertionError("Workflow execution failed")
 
-            processor.load_program_direct(machine_code)
-            success = processor.run(max_cycles=50)
-            if not success:
-                raise AssertionError("Workflow execution failed")
-
-            result = processor.data_memory.read_word(0x1000)
-            if result != 10:
-                raise AssertionError(f"Expected accumulated result 10, got {result}")
+        result = processor.data_memory.read_word(0x1000)
+        if result != 10:
+            raise AssertionError(f"Expected accumulated result 10, got {result}")
 
+        if self.verbose:
             print("   Complete workflow assembled, executed, and verified")
 
-            return {
-                'instructions': len(machine_code),
-                'cycles': processor.cycle_count,
-                'result': result
-            }
-        finally:
-            os.unlink(temp_file)
+        return {
+            'instructions': len(machine_code),
+            'cycles': processor.cycle_count,
+            'result': result
+        }
     
-    def run_all_tests(self):
-        """Εκτελεί όλα τα tests"""
+    def run_all_tests(self, parallel: bool = False):
+        """
+        Εκτελεί όλα τα tests
+        
+        Args:
+            parallel (bool): Κάθε test σε ξεχωριστό process (τα tests δεν μοιράζονται state)
+        """
         print("Starting ultimate RISC-V simulator testing...")
         
         # Execute all tests
         results = {}
         
-        results['memory'] = self.run_test("Advanced Memory Operations", self.test_memory_operations_advanced)
-        results['exceptions'] = self.run_test("Exception Handling", self.test_exception_handling_comprehensive)
-        results['debugging'] = self.run_test("Logging & Debugging", self.test_logging_and_debugging)
-        results['performance'] = self.run_test("Performance Stress Test", self.test_performance_stress)
-        results['edge_cases'] = self.run_test("Edge Cases", self.test_edge_cases_comprehensive)
-        results['workflow'] = self.run_test("Complete Workflow", self.test_complete_workflow)
+        if parallel:
+            # Processes, όχι threads: τα tests είναι CPU-bound Python code (GIL)
+            with ProcessPoolExecutor(max_workers=min(len(self.TESTS), os.cpu_count() or 1)) as pool:
+                futures = [pool.submit(_run_in_worker, method_name) for _, _, method_name in self.TESTS]
+                
+                # Αναφορά με τη σειρά των tests, ώστε το output να μη μπερδεύεται
+                for (key, test_name, _), future in zip(self.TESTS, futures):
+                    result, error, execution_ns, output = future.result()
+                    self._begin_test(test_name)
+                    sys.stdout.write(output)
+                    results[key] = self._record_result(test_name, result, error, execution_ns)
+        else:
+            for key, test_name, method_name in self.TESTS:
+                results[key] = self.run_test(test_name, getattr(self, method_name))
         
         # Performance summary
         print("\n" + "="*60)
@@ -527,11 +644,11 @@ class UltimateTestSuite:
         
         # Performance metrics
         print(f"\n⚡ PERFORMANCE METRICS:")
-        total_time = sum(self.performance_data.values())
+        total_time = sum(self.performance_data.values()) / 1e9
         print(f"Total execution time: {total_time:.3f}s")
         
-        for test_name, time_taken in self.performance_data.items():
-            print(f"  {test_name}: {time_taken:.3f}s")
+        for test_name, time_taken_ns in self.performance_data.items():
+            print(f"  {test_name}: {time_taken_ns / 1e9:.3f}s")
         
         # Feature verification
         print(f"\n🔧 FEATURE VERIFICATION:")
@@ -566,11 +683,12 @@ class UltimateTestSuite:
 def main():
     """Main function"""
     print("🌟 Initializing Ultimate RISC-V Test Suite...")
+    parallel = '--parallel' in sys.argv[1:]
     
     # Check components availability
     try:
         test_suite = UltimateTestSuite()
-        success, results = test_suite.run_all_tests()
+        success, results = test_suite.run_all_tests(parallel=parallel)
         
         if success:
             print("\n🎊 ALL SYSTEMS GO! The RISC-V simulator is space-ready! 🛸")
@@ -19,19 +19,67 @@ from test_utils import add_src_to_path, configure_utf8_stdio
 
 configure_utf8_stdio()
 add_src_to_path()
+from MainCPU import RiscVProcessor
+from Assembler import RiscVAssembler
 
+import io
+import copy
 import time
 import os
-import tempfile
 import threading
 import random
 import json
-from typing import List, Dict, Any
+import hashlib
+import traceback
+from array import array
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from typing import List, Dict, Any, Tuple
 from dataclasses import dataclass
 
+# JSON encoder για το detailed report: orjson → stdlib json (και τα δύο δίνουν bytes)
+try:
+    import orjson  # Optional: γρηγορότερος encoder
+    
+    def _json_dumps_report(obj) -> bytes:
+        # NON_STR_KEYS: τα lab memory_state έχουν int addresses ως keys (όπως το stdlib json)
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    def _json_dumps_report(obj) -> bytes:
+        return json.dumps(obj, indent=2, sort_keys=False).encode('utf-8')
+
+
+def _write_report_stream(f, envelope: Dict[str, Any], scenarios) -> None:
+    """
+    Γράφει το report ως {**envelope, 'scenarios': [...]}, ένα scenario τη φορά
+    
+    Το output είναι ίδιο με το _json_dumps_report του πλήρους dict, αλλά
+    στη μνήμη κρατιέται μόνο το τρέχον scenario (όχι όλο το array).
+    
+    Args:
+        f: Binary file object
+        envelope: Τα top-level πεδία εκτός από το 'scenarios'
+        scenarios: Iterable από scenario dicts
+    """
+    # Envelope χωρίς το closing brace ("{}" για κενό envelope, χωρίς πεδία πριν)
+    head = _json_dumps_report(envelope).rstrip()[:-1].rstrip()
+    f.write(head + (b',\n  "scenarios": [' if envelope else b'\n  "scenarios": ['))
+    
+    count = 0
+    for scenario in scenarios:
+        # Re-indent κατά 4 spaces: το scenario είναι 2 επίπεδα μέσα στο report
+        f.write((b',\n    ' if count else b'\n    ') + _json_dumps_report(scenario).replace(b'\n', b'\n    '))
+        count += 1
+    
+    f.write(b'\n  ]\n}' if count else b']\n}')
+
+
 @dataclass
 class ScenarioResult:
-    """Result από έναν real-world scenario"""
+    """Result από έναν real-world scenario (slotted, χωρίς per-instance __dict__)"""
+    __slots__ = ('name', 'success', 'duration', 'metrics', 'issues', 'recommendations')
+    
     name: str
     success: bool
     duration: float
@@ -40,6 +88,278 @@ class ScenarioResult:
     recommendations: List[str]
 
 
+# Σειρά πεδίων του exported scenario (ίδια με τη σειρά των slots)
+_RESULT_FIELDS = ScenarioResult.__slots__
+
+
+def _elapsed_seconds(start_ns: int) -> float:
+    """Δευτερόλεπτα από ένα time.perf_counter_ns() timestamp (monotonic, μετατροπή μόνο εδώ)"""
+    return (time.perf_counter_ns() - start_ns) / 1e9
+
+
+# Assembled machine code ανά SHA-1 του source, ώστε τα ίδια programs να γίνονται assemble μία φορά
+_ASM_CACHE: Dict[str, array] = {}
+
+
+def _assemble_cached(assembler, source: str) -> array:
+    """
+    Κάνει assemble ένα program με memoization στο _ASM_CACHE
+    
+    Args:
+        assembler: RiscVAssembler instance
+        source (str): Assembly κώδικας
+        
+    Returns:
+        array: Machine code ως array('H'), 2 bytes/εντολή (κενό αν το assembly απέτυχε)
+    """
+    key = hashlib.sha1(source.encode()).hexdigest()
+    machine_code = _ASM_CACHE.get(key)
+    if machine_code is None:
+        # In-memory, χωρίς temp αρχείο. Το array('H') φορτώνεται στην instruction memory με ένα slice copy
+        machine_code = array('H', assembler.assemble_source(source))
+        if machine_code:  # Αποτυχημένα assemblies δεν μπαίνουν στο cache
+            _ASM_CACHE[key] = machine_code
+    return machine_code
+
+
+# Embedded controller program (EmbeddedSystemScenario)
+_EMBEDDED_PROGRAM = """
+    # Embedded System Controller
+    # Monitors 4 sensors and controls 2 actuators
+    
+    main:
+        # Initialize system
+        addi x1, x0, 0      # sensor_sum = 0
+        addi x2, x0, 4      # sensor_count = 4
+        addi x3, x0, 0      # loop_counter = 0
+        addi x4, x0, 10     # threshold = 10
+        
+    sensor_loop:
+        # Read sensors (simulated with computed values)
+        addi x5, x3, 5      # sensor_value = base + offset
+        add x1, x1, x5      # sensor_sum += sensor_value
+        sw x5, 0(x3)        # store sensor reading
+        
+        addi x3, x3, 1      # loop_counter++
+        bne x3, x2, sensor_loop
+        
+    # Calculate average
+    # Since we don't have division, use threshold comparison
+    control_logic:
+        # Check if sum > threshold * count (40)
+        addi x6, x0, 15     # compare_value = 15 (approx threshold)
+        
+        # Simple control: if sensor_sum > compare_value, activate actuator
+        lw x7, 0(x0)        # Load first sensor
+        lw x8, 1(x0)        # Load second sensor
+        add x9, x7, x8      # Combined reading
+        
+        # Control actuator 1
+        beq x9, x6, actuator_off
+        addi x10, x0, 1     # actuator_1 = ON
+        sw x10, 8(x0)       # Store actuator state
+        beq x0, x0, actuator_done
+        
+    actuator_off:
+        addi x10, x0, 0     # actuator_1 = OFF
+        sw x10, 8(x0)       # Store actuator state
+        
+    actuator_done:
+        # Control actuator 2 (inverse logic)
+        beq x10, x0, actuator2_on
+        addi x11, x0, 0     # actuator_2 = OFF
+        sw x11, 9(x0)       # Store actuator 2 state
+        beq x0, x0, system_done
+        
+    actuator2_on:
+        addi x11, x0, 1     # actuator_2 = ON
+        sw x11, 9(x0)       # Store actuator 2 state
+        
+    system_done:
+        # Store final system state
+        sw x1, 15(x0)       # Store sensor sum
+        halt
+    """
+
+# Educational lab programs (EducationalScenario)
+_EDUCATIONAL_PROGRAMS = [
+    # Program 1: Basic arithmetic
+    """
+    # Lab 1: Basic Arithmetic
+    main:
+        addi x1, x0, 15     # Load constant
+        addi x2, x0, 7      # Load another constant
+        add x3, x1, x2      # Addition
+        sub x4, x1, x2      # Subtraction
+        and x5, x1, x2      # Bitwise AND
+        or x6, x1, x2       # Bitwise OR
+        halt
+    """,
+    
+    # Program 2: Memory operations
+    """
+    # Lab 2: Memory Operations
+    main:
+        addi x1, x0, 10     # Data value
+        addi x2, x0, 20     # Another value
+        sw x1, 0(x0)        # Store first value
+        sw x2, 1(x0)        # Store second value
+        lw x3, 0(x0)        # Load first value
+        lw x4, 1(x0)        # Load second value
+        add x5, x3, x4      # Add loaded values
+        sw x5, 2(x0)        # Store result
+        halt
+    """,
+    
+    # Program 3: Control flow
+    """
+    # Lab 3: Control Flow
+    main:
+        addi x1, x0, 5      # Counter
+        addi x2, x0, 0      # Accumulator
+        
+    loop:
+        beq x1, x0, done    # Check if counter is zero
+        add x2, x2, x1      # Add counter to accumulator
+        addi x1, x1, -1     # Decrement counter (using -1 as 15)
+        bne x1, x0, loop    # Continue if not zero
+        
+    done:
+        sw x2, 5(x0)        # Store final result
+        halt
+    """
+]
+
+# Research workloads (ResearchScenario)
+_RESEARCH_WORKLOADS = [
+    {
+        'name': 'Instruction Set Coverage',
+        'program': """
+        # ISA Coverage Test
+        main:
+            # R-type instructions
+            addi x1, x0, 7
+            addi x2, x0, 3
+            add x3, x1, x2      # R-type
+            sub x4, x1, x2      # R-type
+            and x5, x1, x2      # R-type
+            or x6, x1, x2       # R-type
+            xor x7, x1, x2      # R-type
+            
+            # I-type instructions
+            addi x8, x0, 10     # I-type
+            andi x9, x8, 7      # I-type
+            ori x10, x8, 3      # I-type
+            
+            # Memory instructions
+            sw x3, 0(x0)        # S-type
+            lw x11, 0(x0)       # I-type (load)
+            
+            # Control instructions
+            beq x3, x11, skip   # B-type
+            addi x12, x0, 1
+        skip:
+            jal x13, end        # J-type
+            addi x14, x0, 2     # Should be skipped
+        end:
+            halt                # Special
+        """
+    },
+    {
+        'name': 'Pipeline Stress Test',
+        'program': """
+        # Pipeline Dependencies Test
+        main:
+            addi x1, x0, 1      # No dependency
+            addi x2, x1, 1      # RAW dependency on x1
+            add x3, x1, x2      # RAW dependencies on x1, x2
+            sub x4, x3, x1      # RAW dependency on x3
+            and x5, x4, x2      # RAW dependency on x4
+            sw x5, 0(x0)        # Memory dependency
+            lw x6, 0(x0)        # Load-use dependency
+            add x7, x6, x5      # RAW dependency on x6
+            halt
+        """
+    },
+    {
+        'name': 'Memory Hierarchy Test',
+        'program': """
+        # Memory Access Patterns
+        main:
+            addi x1, x0, 0      # Base address
+            addi x2, x0, 8      # Loop limit
+            addi x3, x0, 0      # Loop counter
+            
+        write_loop:
+            beq x3, x2, read_phase
+            sw x3, 0(x3)        # Store index at address[index]
+            addi x3, x3, 1
+            bne x3, x2, write_loop
+            
+        read_phase:
+            addi x3, x0, 0      # Reset counter
+            addi x4, x0, 0      # Sum accumulator
+            
+        read_loop:
+            beq x3, x2, done
+            lw x5, 0(x3)        # Load from address[index]
+            add x4, x4, x5      # Accumulate
+            addi x3, x3, 1
+            bne x3, x2, read_loop
+            
+        done:
+            sw x4, 15(x0)       # Store final sum
+            halt
+        """
+    }
+]
+
+# Production stress test program (ProductionScenario)
+_STRESS_PROGRAM = """
+    # Production Stress Test Program
+    main:
+        addi x1, x0, 0      # Counter
+        addi x2, x0, 10     # Limit
+        addi x3, x0, 0      # Accumulator
+        
+    outer_loop:
+        beq x1, x2, done
+        addi x4, x0, 0      # Inner counter
+        
+    inner_loop:
+        beq x4, x2, outer_next
+        
+        # Memory stress
+        sw x4, 0(x4)        # Store counter at address[counter]
+        lw x5, 0(x4)        # Load it back
+        add x3, x3, x5      # Accumulate
+        
+        # ALU stress
+        add x6, x4, x1      # Multiple ALU ops
+        sub x7, x6, x4
+        and x8, x7, x1
+        or x9, x8, x4
+        
+        addi x4, x4, 1
+        bne x4, x2, inner_loop
+        
+    outer_next:
+        addi x1, x1, 1
+        bne x1, x2, outer_loop
+        
+    done:
+        sw x3, 15(x0)       # Store final result
+        halt
+    """
+
+# Όλα τα programs είναι σταθερά: assembled μία φορά στο import, τα scenarios βρίσκουν cache hit
+_SHARED_ASSEMBLER = RiscVAssembler()
+with redirect_stdout(io.StringIO()):  # Χωρίς assembler output κατά το import
+    for _source in [_EMBEDDED_PROGRAM, *_EDUCATIONAL_PROGRAMS, *(w['program'] for w in _RESEARCH_WORKLOADS)]:
+        _assemble_cached(_SHARED_ASSEMBLER, _source)
+    _STRESS_MACHINE_CODE = _assemble_cached(_SHARED_ASSEMBLER, _STRESS_PROGRAM)
+
+
 class EmbeddedSystemScenario:
     """Embedded system simulation scenario"""
     
@@ -49,87 +369,20 @@ class EmbeddedSystemScenario:
     
     def run(self) -> ScenarioResult:
         """Run embedded system scenario"""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         issues = []
         recommendations = []
         
         try:
-            from MainCPU import RiscVProcessor
-            from Assembler import RiscVAssembler
-            
-            # Embedded control program
-            embedded_program = """
-            # Embedded System Controller
-            # Monitors 4 sensors and controls 2 actuators
-            
-            main:
-                # Initialize system
-                addi x1, x0, 0      # sensor_sum = 0
-                addi x2, x0, 4      # sensor_count = 4
-                addi x3, x0, 0      # loop_counter = 0
-                addi x4, x0, 10     # threshold = 10
-                
-            sensor_loop:
-                # Read sensors (simulated with computed values)
-                addi x5, x3, 5      # sensor_value = base + offset
-                add x1, x1, x5      # sensor_sum += sensor_value
-                sw x5, 0(x3)        # store sensor reading
-                
-                addi x3, x3, 1      # loop_counter++
-                bne x3, x2, sensor_loop
-                
-            # Calculate average
-            # Since we don't have division, use threshold comparison
-            control_logic:
-                # Check if sum > threshold * count (40)
-                addi x6, x0, 15     # compare_value = 15 (approx threshold)
-                
-                # Simple control: if sensor_sum > compare_value, activate actuator
-                lw x7, 0(x0)        # Load first sensor
-                lw x8, 1(x0)        # Load second sensor
-                add x9, x7, x8      # Combined reading
-                
-                # Control actuator 1
-                beq x9, x6, actuator_off
-                addi x10, x0, 1     # actuator_1 = ON
-                sw x10, 8(x0)       # Store actuator state
-                beq x0, x0, actuator_done
-                
-            actuator_off:
-                addi x10, x0, 0     # actuator_1 = OFF
-                sw x10, 8(x0)       # Store actuator state
-                
-            actuator_done:
-                # Control actuator 2 (inverse logic)
-                beq x10, x0, actuator2_on
-                addi x11, x0, 0     # actuator_2 = OFF
-                sw x11, 9(x0)       # Store actuator 2 state
-                beq x0, x0, system_done
-                
-            actuator2_on:
-                addi x11, x0, 1     # actuator_2 = ON
-                sw x11, 9(x0)       # Store actuator 2 state
-                
-            system_done:
-                # Store final system state
-                sw x1, 15(x0)       # Store sensor sum
-                halt
-            """
-            
             processor = RiscVProcessor(64, 64)
             assembler = RiscVAssembler()
             
             # Assembly and execution
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.asm', delete=False) as f:
-                f.write(embedded_program)
-                temp_file = f.name
-            
-            machine_code = assembler.assemble_file(temp_file)
-            os.unlink(temp_file)
+            machine_code = _assemble_cached(assembler, _EMBEDDED_PROGRAM)
             
             if not machine_code:
                 issues.append("Assembly failed for embedded program")
-                return ScenarioResult(self.name, False, time.time() - start_time, {}, issues, recommendations)
+                return ScenarioResult(self.name, False, _elapsed_seconds(start_ns), {}, issues, recommendations)
             
             processor.load_program_direct(machine_code)
             success = processor.run(max_cycles=100)
@@ -137,13 +390,10 @@ class EmbeddedSystemScenario:
             if not success:
                 issues.append("Embedded program execution failed")
             
-            # Analyze results
-            sensor_readings = []
-            for i in range(4):
-                sensor_readings.append(processor.data_memory.read_word(0x1000 + i))
+            # Analyze results (bulk reads: ένα slice αντί για ένα read_word ανά λέξη)
+            sensor_readings = processor.data_memory.read_words(0x1000, 4)
             
-            actuator_1 = processor.data_memory.read_word(0x1008)
-            actuator_2 = processor.data_memory.read_word(0x1009)
+            actuator_1, actuator_2 = processor.data_memory.read_words(0x1008, 2)
             sensor_sum = processor.data_memory.read_word(0x100F)
             
             # Validate embedded system behavior
@@ -171,7 +421,7 @@ class EmbeddedSystemScenario:
             return ScenarioResult(
                 self.name,
                 len(issues) == 0,
-                time.time() - start_time,
+                _elapsed_seconds(start_ns),
                 metrics,
                 issues,
                 recommendations
@@ -179,7 +429,7 @@ class EmbeddedSystemScenario:
             
         except Exception as e:
             issues.append(f"Critical error: {str(e)}")
-            return ScenarioResult(self.name, False, time.time() - start_time, {}, issues, recommendations)
+            return ScenarioResult(self.name, False, _elapsed_seconds(start_ns), {}, issues, recommendations)
 
 
 class EducationalScenario:
@@ -191,101 +441,24 @@ class EducationalScenario:
     
     def run(self) -> ScenarioResult:
         """Run educational scenario"""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         issues = []
         recommendations = []
         
         try:
-            from MainCPU import RiscVProcessor
-            from Assembler import RiscVAssembler
-            
-            # Educational programs: basic concepts
-            educational_programs = [
-                # Program 1: Basic arithmetic
-                """
-                # Lab 1: Basic Arithmetic
-                main:
-                    addi x1, x0, 15     # Load constant
-                    addi x2, x0, 7      # Load another constant
-                    add x3, x1, x2      # Addition
-                    sub x4, x1, x2      # Subtraction
-                    and x5, x1, x2      # Bitwise AND
-                    or x6, x1, x2       # Bitwise OR
-                    halt
-                """,
-                
-                # Program 2: Memory operations
-                """
-                # Lab 2: Memory Operations
-                main:
-                    addi x1, x0, 10     # Data value
-                    addi x2, x0, 20     # Another value
-                    sw x1, 0(x0)        # Store first value
-                    sw x2, 1(x0)        # Store second value
-                    lw x3, 0(x0)        # Load first value
-                    lw x4, 1(x0)        # Load second value
-                    add x5, x3, x4      # Add loaded values
-                    sw x5, 2(x0)        # Store result
-                    halt
-                """,
-                
-                # Program 3: Control flow
-                """
-                # Lab 3: Control Flow
-                main:
-                    addi x1, x0, 5      # Counter
-                    addi x2, x0, 0      # Accumulator
-                    
-                loop:
-                    beq x1, x0, done    # Check if counter is zero
-                    add x2, x2, x1      # Add counter to accumulator
-                    addi x1, x1, -1     # Decrement counter (using -1 as 15)
-                    bne x1, x0, loop    # Continue if not zero
-                    
-                done:
-                    sw x2, 5(x0)        # Store final result
-                    halt
-                """
-            ]
-            
             processor = RiscVProcessor(64, 64)
             assembler = RiscVAssembler()
             
             program_results = []
             
-            for i, program in enumerate(educational_programs):
+            for i, program in enumerate(_EDUCATIONAL_PROGRAMS):
                 # Run each educational program
-                with tempfile.NamedTemporaryFile(mode='w', suffix='.asm', delete=False) as f:
-                    f.write(program)
-                    temp_file = f.name
-                
-                machine_code = assembler.assemble_file(temp_file)
-                os.unlink(temp_file)
-                
-                if not machine_code:
-                    issues.append(f"Lab {i+1} assembly failed")
-                    continue
-                
-                processor.reset()
-                processor.load_program_direct(machine_code)
-                success = processor.run(max_cycles=50)
-                
-                if not success:
-                    issues.append(f"Lab {i+1} execution failed")
-                    continue
-                
-                # Collect results for analysis
-                lab_result = {
-                    'lab_number': i + 1,
-                    'cycles': processor.cycle_count,
-                    'instructions': len(machine_code),
-                    'final_registers': [processor.register_file.read(j) for j in range(8)],
-                    'memory_state': processor.data_memory.find_non_zero()
-                }
-                program_results.append(lab_result)
+                lab_result = self._run_lab(processor, assembler, i + 1, program, issues)
+                if lab_result is not None:
+                    program_results.append(lab_result)
             
             # Educational assessment
-            if len(program_results) < len(educational_programs):
+            if len(program_results) < len(_EDUCATIONAL_PROGRAMS):
                 issues.append("Some educational programs failed to complete")
             
             # Check learning objectives
@@ -299,13 +472,13 @@ class EducationalScenario:
             
             # Lab 2: Memory operations
             if len(program_results) > 1:
-                lab2_memory = dict(program_results[1]['memory_state'])
+                lab2_memory = program_results[1]['memory_state']
                 if 0x1002 not in lab2_memory or lab2_memory[0x1002] != 30:  # 10 + 20
                     issues.append("Lab 2: Memory operations learning objective not met")
             
             # Lab 3: Control flow
             if len(program_results) > 2:
-                lab3_memory = dict(program_results[2]['memory_state'])
+                lab3_memory = program_results[2]['memory_state']
                 # Expected result: 5+4+3+2+1 = 15 (but due to our decrement encoding, might be different)
                 if 0x1005 not in lab3_memory:
                     issues.append("Lab 3: Control flow learning objective not met")
@@ -322,7 +495,7 @@ class EducationalScenario:
             
             metrics = {
                 'completed_labs': len(program_results),
-                'total_labs': len(educational_programs),
+                'total_labs': len(_EDUCATIONAL_PROGRAMS),
                 'total_execution_cycles': total_cycles,
                 'average_cycles_per_lab': avg_cycles_per_lab,
                 'lab_results': program_results
@@ -331,7 +504,7 @@ class EducationalScenario:
             return ScenarioResult(
                 self.name,
                 len(issues) == 0,
-                time.time() - start_time,
+                _elapsed_seconds(start_ns),
                 metrics,
                 issues,
                 recommendations
@@ -339,7 +512,36 @@ class EducationalScenario:
             
         except Exception as e:
             issues.append(f"Educational scenario error: {str(e)}")
-            return ScenarioResult(self.name, False, time.time() - start_time, {}, issues, recommendations)
+            return ScenarioResult(self.name, False, _elapsed_seconds(start_ns), {}, issues, recommendations)
+    
+    def _run_lab(self, processor, assembler, lab_number, program, issues):
+        """
+        Run one educational lab (independent unit: reset processor, own results)
+        
+        Returns:
+            dict: lab_result, ή None αν το lab απέτυχε (το issue προστίθεται στο issues)
+        """
+        machine_code = _assemble_cached(assembler, program)
+        
+        if not machine_code:
+            issues.append(f"Lab {lab_number} assembly failed")
+            return None
+        
+        processor.reload_program(machine_code)
+        success = processor.run(max_cycles=50)
+        
+        if not success:
+            issues.append(f"Lab {lab_number} execution failed")
+            return None
+        
+        # Collect results for analysis
+        return {
+            'lab_number': lab_number,
+            'cycles': processor.cycle_count,
+            'instructions': len(machine_code),
+            'final_registers': [processor.register_file.read(j) for j in range(8)],
+            'memory_state': dict(processor.data_memory.find_non_zero())  # address → value, μία φορά
+        }
 
 
 class ResearchScenario:
@@ -351,162 +553,56 @@ class ResearchScenario:
     
     def run(self) -> ScenarioResult:
         """Run research scenario"""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         issues = []
         recommendations = []
         
         try:
-            from MainCPU import RiscVProcessor
-            from Assembler import RiscVAssembler
-            
-            # Research workloads
-            research_workloads = [
-                {
-                    'name': 'Instruction Set Coverage',
-                    'program': """
-                    # ISA Coverage Test
-                    main:
-                        # R-type instructions
-                        addi x1, x0, 7
-                        addi x2, x0, 3
-                        add x3, x1, x2      # R-type
-                        sub x4, x1, x2      # R-type
-                        and x5, x1, x2      # R-type
-                        or x6, x1, x2       # R-type
-                        xor x7, x1, x2      # R-type
-                        
-                        # I-type instructions
-                        addi x8, x0, 10     # I-type
-                        andi x9, x8, 7      # I-type
-                        ori x10, x8, 3      # I-type
-                        
-                        # Memory instructions
-                        sw x3, 0(x0)        # S-type
-                        lw x11, 0(x0)       # I-type (load)
-                        
-                        # Control instructions
-                        beq x3, x11, skip   # B-type
-                        addi x12, x0, 1
-                    skip:
-                        jal x13, end        # J-type
-                        addi x14, x0, 2     # Should be skipped
-                    end:
-                        halt                # Special
-                    """
-                },
-                {
-                    'name': 'Pipeline Stress Test',
-                    'program': """
-                    # Pipeline Dependencies Test
-                    main:
-                        addi x1, x0, 1      # No dependency
-                        addi x2, x1, 1      # RAW dependency on x1
-                        add x3, x1, x2      # RAW dependencies on x1, x2
-                        sub x4, x3, x1      # RAW dependency on x3
-                        and x5, x4, x2      # RAW dependency on x4
-                        sw x5, 0(x0)        # Memory dependency
-                        lw x6, 0(x0)        # Load-use dependency
-                        add x7, x6, x5      # RAW dependency on x6
-                        halt
-                    """
-                },
-                {
-                    'name': 'Memory Hierarchy Test',
-                    'program': """
-                    # Memory Access Patterns
-                    main:
-                        addi x1, x0, 0      # Base address
-                        addi x2, x0, 8      # Loop limit
-                        addi x3, x0, 0      # Loop counter
-                        
-                    write_loop:
-                        beq x3, x2, read_phase
-                        sw x3, 0(x3)        # Store index at address[index]
-                        addi x3, x3, 1
-                        bne x3, x2, write_loop
-                        
-                    read_phase:
-                        addi x3, x0, 0      # Reset counter
-                        addi x4, x0, 0      # Sum accumulator
-                        
-                    read_loop:
-                        beq x3, x2, done
-                        lw x5, 0(x3)        # Load from address[index]
-                        add x4, x4, x5      # Accumulate
-                        addi x3, x3, 1
-                        bne x3, x2, read_loop
-                        
-                    done:
-                        sw x4, 15(x0)       # Store final sum
-                        halt
-                    """
-                }
-            ]
-            
             processor = RiscVProcessor(128, 128)
             assembler = RiscVAssembler()
             
             workload_results = []
+            types_seen = set()      # Instruction stat types όλων των workloads
+            types_nonzero = set()   # ...και όσα εκτελέστηκαν έστω σε ένα workload
             
-            for workload in research_workloads:
+            for workload in _RESEARCH_WORKLOADS:
                 # Execute each research workload
-                with tempfile.NamedTemporaryFile(mode='w', suffix='.asm', delete=False) as f:
-                    f.write(workload['program'])
-                    temp_file = f.name
-                
-                machine_code = assembler.assemble_file(temp_file)
-                os.unlink(temp_file)
-                
-                if not machine_code:
-                    issues.append(f"Research workload '{workload['name']}' assembly failed")
-                    continue
-                
-                processor.reset()
-                processor.load_program_direct(machine_code)
-                
-                # Detailed execution monitoring
-                execution_start = time.time()
-                success = processor.run(max_cycles=200)
-                execution_time = time.time() - execution_start
-                
-                if not success:
-                    issues.append(f"Research workload '{workload['name']}' execution failed")
-                    continue
-                
-                # Collect detailed metrics
-                workload_result = {
-                    'name': workload['name'],
-                    'execution_time': execution_time,
-                    'cycles': processor.cycle_count,
-                    'instructions': len(machine_code),
-                    'cpi': processor.cycle_count / len(machine_code) if machine_code else 0,
-                    'instruction_mix': dict(processor.stats),
-                    'memory_stats': processor.data_memory.get_statistics(),
-                    'alu_operations': processor.alu.operations_count,
-                    'branch_efficiency': self._calculate_branch_efficiency(processor.stats)
-                }
-                workload_results.append(workload_result)
+                workload_result = self._run_workload(processor, assembler, workload, issues)
+                if workload_result is not None:
+                    workload_results.append(workload_result)
+                    
+                    # Coverage incrementally από τα stats του workload (πριν το επόμενο reset)
+                    stats = processor.stats
+                    types_seen.update(stats)
+                    types_nonzero.update(inst_type for inst_type, count in stats.items() if count)
             
             # Research analysis
-            if len(workload_results) < len(research_workloads):
+            if len(workload_results) < len(_RESEARCH_WORKLOADS):
                 issues.append("Some research workloads failed - limits research capability")
             
+            # CPI και totals σε ένα pass πάνω στα workload results
+            cpi_total = 0
+            min_cpi = max_cpi = workload_results[0]['cpi'] if workload_results else 0
+            total_cycles = 0
+            total_instructions = 0
+            
+            for workload in workload_results:
+                cpi = workload['cpi']
+                cpi_total += cpi
+                if cpi < min_cpi:
+                    min_cpi = cpi
+                elif cpi > max_cpi:
+                    max_cpi = cpi
+                total_cycles += workload['cycles']
+                total_instructions += workload['instructions']
+            
             # Performance analysis
-            avg_cpi = sum(w['cpi'] for w in workload_results) / len(workload_results) if workload_results else 0
+            avg_cpi = cpi_total / len(workload_results) if workload_results else 0
             if avg_cpi > 2.0:
                 recommendations.append("High CPI detected - consider performance optimizations for research use")
             
             # Instruction coverage analysis
-            total_instruction_types = 0
-            covered_instruction_types = 0
-            
-            for workload in workload_results:
-                for inst_type, count in workload['instruction_mix'].items():
-                    total_instruction_types += 1
-                    if count > 0:
-                        covered_instruction_types += 1
-            
-            coverage_ratio = covered_instruction_types / total_instruction_types if total_instruction_types > 0 else 0
+            coverage_ratio = len(types_nonzero) / len(types_seen) if types_seen else 0
             if coverage_ratio < 0.8:
                 recommendations.append("Limited instruction set coverage - may not suit all research needs")
             
@@ -520,22 +616,22 @@ class ResearchScenario:
             
             metrics = {
                 'completed_workloads': len(workload_results),
-                'total_workloads': len(research_workloads),
+                'total_workloads': len(_RESEARCH_WORKLOADS),
                 'average_cpi': avg_cpi,
                 'instruction_coverage': coverage_ratio,
                 'workload_details': workload_results,
                 'performance_summary': {
-                    'min_cpi': min(w['cpi'] for w in workload_results) if workload_results else 0,
-                    'max_cpi': max(w['cpi'] for w in workload_results) if workload_results else 0,
-                    'total_cycles': sum(w['cycles'] for w in workload_results),
-                    'total_instructions': sum(w['instructions'] for w in workload_results)
+                    'min_cpi': min_cpi,
+                    'max_cpi': max_cpi,
+                    'total_cycles': total_cycles,
+                    'total_instructions': total_instructions
                 }
             }
             
             return ScenarioResult(
                 self.name,
                 len(issues) == 0,
-                time.time() - start_time,
+                _elapsed_seconds(start_ns),
                 metrics,
                 issues,
                 recommendations
@@ -543,17 +639,51 @@ class ResearchScenario:
             
         except Exception as e:
             issues.append(f"Research scenario error: {str(e)}")
-            return ScenarioResult(self.name, False, time.time() - start_time, {}, issues, recommendations)
+            return ScenarioResult(self.name, False, _elapsed_seconds(start_ns), {}, issues, recommendations)
+    
+    def _run_workload(self, processor, assembler, workload, issues):
+        """
+        Execute one research workload (independent unit: reset processor, own metrics)
+        
+        Returns:
+            dict: workload_result, ή None αν το workload απέτυχε (το issue προστίθεται στο issues)
+        """
+        machine_code = _assemble_cached(assembler, workload['program'])
+        
+        if not machine_code:
+            issues.append(f"Research workload '{workload['name']}' assembly failed")
+            return None
+        
+        processor.reload_program(machine_code)
+        
+        # Detailed execution monitoring
+        execution_start = time.perf_counter_ns()
+        success = processor.run(max_cycles=200)
+        execution_ns = time.perf_counter_ns() - execution_start
+        
+        if not success:
+            issues.append(f"Research workload '{workload['name']}' execution failed")
+            return None
+        
+        # Collect detailed metrics
+        return {
+            'name': workload['name'],
+            'execution_time': execution_ns / 1e9,
+            'cycles': processor.cycle_count,
+            'instructions': len(machine_code),
+            'cpi': processor.cycle_count / len(machine_code) if machine_code else 0,
+            'memory_stats': processor.data_memory.get_statistics(),
+            'alu_operations': processor.alu.operations_count,
+            'branch_efficiency': self._calculate_branch_efficiency(processor.stats)
+        }
     
     def _calculate_branch_efficiency(self, stats):
         """Calculate branch prediction efficiency"""
-        total_branches = stats.get('branches_taken', 0) + stats.get('branches_not_taken', 0)
-        if total_branches == 0:
-            return 1.0
+        taken = stats.get('branches_taken', 0)
+        total_branches = taken + stats.get('branches_not_taken', 0)
         
-        # Simple efficiency metric
-        taken_ratio = stats.get('branches_taken', 0) / total_branches
-        return 1.0 - abs(0.5 - taken_ratio)  # Efficiency peaks at 50% taken rate
+        # Efficiency peaks at 50% taken rate (1.0 όταν δεν υπάρχουν branches)
+        return 1.0 - abs(0.5 - taken / total_branches) if total_branches else 1.0
 
 
 class ProductionScenario:
@@ -565,14 +695,11 @@ class ProductionScenario:
     
     def run(self) -> ScenarioResult:
         """Run production scenario"""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         issues = []
         recommendations = []
         
         try:
-            from MainCPU import RiscVProcessor
-            from Assembler import RiscVAssembler
-            
             # Production stress tests
             stress_tests = [
                 {
@@ -593,53 +720,34 @@ class ProductionScenario:
             ]
             
             processor = RiscVProcessor(256, 256)
-            assembler = RiscVAssembler()
-            
-            # Generate stress test program
-            stress_program = self._generate_stress_program()
-            
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.asm', delete=False) as f:
-                f.write(stress_program)
-                temp_file = f.name
             
-            machine_code = assembler.assemble_file(temp_file)
-            os.unlink(temp_file)
+            # Stress program assembled μία φορά στο import
+            machine_code = _STRESS_MACHINE_CODE
             
             if not machine_code:
                 issues.append("Production stress test assembly failed")
-                return ScenarioResult(self.name, False, time.time() - start_time, {}, issues, recommendations)
+                return ScenarioResult(self.name, False, _elapsed_seconds(start_ns), {}, issues, recommendations)
             
             # Execute stress tests
             test_results = []
             
             for test in stress_tests:
-                processor.reset()
-                processor.load_program_direct(machine_code)
-                
-                execution_start = time.time()
-                success = processor.run(max_cycles=test['cycles'])
-                execution_time = time.time() - execution_start
-                
-                if not success and not processor.halted:
-                    issues.append(f"Production test '{test['name']}' failed to complete")
-                    continue
-                
-                # Collect production metrics
-                test_result = {
-                    'name': test['name'],
-                    'execution_time': execution_time,
-                    'cycles_executed': processor.cycle_count,
-                    'max_cycles': test['cycles'],
-                    'completion_rate': processor.cycle_count / test['cycles'] if test['cycles'] > 0 else 0,
-                    'memory_efficiency': self._calculate_memory_efficiency(processor),
-                    'error_rate': self._calculate_error_rate(processor),
-                    'throughput': processor.cycle_count / execution_time if execution_time > 0 else 0
-                }
-                test_results.append(test_result)
-            
-            # Production quality assessment
-            avg_completion_rate = sum(t['completion_rate'] for t in test_results) / len(test_results) if test_results else 0
-            avg_throughput = sum(t['throughput'] for t in test_results) / len(test_results) if test_results else 0
+                test_result = self._run_stress_test(processor, machine_code, test, issues)
+                if test_result is not None:
+                    test_results.append(test_result)
+            
+            # Production quality assessment (ένα pass πάνω στα test results)
+            completion_total = 0
+            throughput_total = 0
+            error_count = 0
+            for test_result in test_results:
+                completion_total += test_result['completion_rate']
+                throughput_total += test_result['throughput']
+                if test_result['error_rate'] > 0.01:
+                    error_count += 1
+            
+            avg_completion_rate = completion_total / len(test_results) if test_results else 0
+            avg_throughput = throughput_total / len(test_results) if test_results else 0
             
             # Production readiness criteria
             if avg_completion_rate < 0.9:
@@ -649,7 +757,6 @@ class ProductionScenario:
                 recommendations.append("Consider performance optimizations for production deployment")
             
             # Reliability assessment
-            error_count = sum(1 for t in test_results if t['error_rate'] > 0.01)
             if error_count > 0:
                 issues.append(f"Error rate too high in {error_count} tests")
             
@@ -674,7 +781,7 @@ class ProductionScenario:
             return ScenarioResult(
                 self.name,
                 len(issues) == 0,
-                time.time() - start_time,
+                _elapsed_seconds(start_ns),
                 metrics,
                 issues,
                 recommendations
@@ -682,61 +789,44 @@ class ProductionScenario:
             
         except Exception as e:
             issues.append(f"Production scenario critical error: {str(e)}")
-            return ScenarioResult(self.name, False, time.time() - start_time, {}, issues, recommendations)
+            return ScenarioResult(self.name, False, _elapsed_seconds(start_ns), {}, issues, recommendations)
     
-    def _generate_stress_program(self):
-        """Generate stress test program"""
-        return """
-        # Production Stress Test Program
-        main:
-            addi x1, x0, 0      # Counter
-            addi x2, x0, 10     # Limit
-            addi x3, x0, 0      # Accumulator
-            
-        outer_loop:
-            beq x1, x2, done
-            addi x4, x0, 0      # Inner counter
-            
-        inner_loop:
-            beq x4, x2, outer_next
-            
-            # Memory stress
-            sw x4, 0(x4)        # Store counter at address[counter]
-            lw x5, 0(x4)        # Load it back
-            add x3, x3, x5      # Accumulate
-            
-            # ALU stress
-            add x6, x4, x1      # Multiple ALU ops
-            sub x7, x6, x4
-            and x8, x7, x1
-            or x9, x8, x4
-            
-            addi x4, x4, 1
-            bne x4, x2, inner_loop
-            
-        outer_next:
-            addi x1, x1, 1
-            bne x1, x2, outer_loop
-            
-        done:
-            sw x3, 15(x0)       # Store final result
-            halt
+    def _run_stress_test(self, processor, machine_code, test, issues):
+        """
+        Run one production stress test (independent unit: reset processor, own metrics)
+        
+        Returns:
+            dict: test_result, ή None αν το test δεν ολοκληρώθηκε (το issue προστίθεται στο issues)
         """
+        processor.reload_program(machine_code)
+        
+        execution_start = time.perf_counter_ns()
+        success = processor.run(max_cycles=test['cycles'])
+        execution_ns = time.perf_counter_ns() - execution_start
+        
+        if not success and not processor.halted:
+            issues.append(f"Production test '{test['name']}' failed to complete")
+            return None
+        
+        # Collect production metrics
+        return {
+            'name': test['name'],
+            'execution_time': execution_ns / 1e9,
+            'cycles_executed': processor.cycle_count,
+            'max_cycles': test['cycles'],
+            'completion_rate': processor.cycle_count / test['cycles'] if test['cycles'] > 0 else 0,
+            'memory_efficiency': self._calculate_memory_efficiency(processor),
+            'error_rate': self._calculate_error_rate(processor),
+            'throughput': processor.cycle_count * 1_000_000_000 / execution_ns if execution_ns > 0 else 0
+        }
     
     def _calculate_memory_efficiency(self, processor):
         """Calculate memory access efficiency"""
-        stats = processor.data_memory.get_statistics()
-        total_accesses = stats['total_accesses']
-        
-        if total_accesses == 0:
-            return 1.0
-        
-        # Simple efficiency based on read/write ratio
-        read_ratio = stats['reads'] / total_accesses
-        write_ratio = stats['writes'] / total_accesses
+        memory = processor.data_memory
+        total_accesses = memory.access_count
         
-        # Balanced access pattern is more efficient
-        return 1.0 - abs(read_ratio - write_ratio)
+        # Balanced read/write pattern is more efficient: |reads - writes| / total σε μία διαίρεση
+        return 1.0 - abs(memory.read_count - memory.write_count) / total_accesses if total_accesses else 1.0
     
     def _calculate_error_rate(self, processor):
         """Calculate estimated error rate"""
@@ -760,6 +850,40 @@ class ProductionScenario:
         return score
 
 
+# Memoized ScenarioResult ανά scenario class, για επαναλαμβανόμενα runs στο ίδιο process.
+# Τα scenarios δεν έχουν inputs (τα programs είναι module constants), οπότε το class αρκεί ως key.
+_SCENARIO_RESULTS: Dict[str, ScenarioResult] = {}
+
+
+def _run_scenario(scenario_cls) -> Tuple[ScenarioResult, str]:
+    """
+    Worker για parallel mode: τρέχει ένα scenario σε ξεχωριστό process
+    
+    Returns:
+        tuple: (ScenarioResult, captured output)
+    """
+    output = io.StringIO()
+    with redirect_stdout(output):
+        result = scenario_cls().run()
+    return result, output.getvalue()
+
+
+# Key metrics του "Use Case Readiness" section: (metrics key, γραμμή report)
+_METRIC_ROWS = (
+    ('execution_cycles', "      Execution: {} cycles"),
+    ('average_cpi', "      Performance: {:.2f} CPI"),
+    ('production_score', "      Production Score: {:.2f}/1.0"),
+)
+
+# Deployment readiness tiers: (ελάχιστο success rate %, status, recommendation), φθίνουσα σειρά
+_READINESS_TIERS = (
+    (90, "🟢 PRODUCTION READY", "System is ready for production deployment across all tested use cases"),
+    (75, "🟡 MOSTLY READY", "System is suitable for most use cases with minor limitations"),
+    (50, "🟠 DEVELOPMENT READY", "System is good for development and testing, needs work for production"),
+    (float('-inf'), "🔴 NOT READY", "System needs significant improvements before any deployment"),
+)
+
+
 class RealWorldTestSuite:
     """Complete real-world testing suite"""
     
@@ -772,24 +896,57 @@ class RealWorldTestSuite:
         ]
         
         self.results = []
+        self._summary = None  # Summary aggregates, υπολογίζονται μία φορά (βλ. _build_summary)
+        self._out = []        # Buffered γραμμές του comprehensive report
     
-    def run_all_scenarios(self):
-        """Run all real-world scenarios"""
+    def run_all_scenarios(self, parallel: bool = False, use_cache: bool = False):
+        """
+        Run all real-world scenarios
+        
+        Args:
+            parallel (bool): Κάθε scenario σε ξεχωριστό process (δεν μοιράζονται processor/assembler)
+            use_cache (bool): Opt-in επαναχρησιμοποίηση results από προηγούμενο run στο ίδιο process
+                (χωρίς invalidation: μόνο όταν processor/scenarios δεν έχουν αλλάξει στο μεταξύ)
+        """
         print("🌍 REAL-WORLD RISC-V TESTING SCENARIOS")
         print("="*50)
         print("Testing production readiness across multiple use cases...")
         print("="*50)
         
-        for scenario in self.scenarios:
+        cached = [_SCENARIO_RESULTS.get(type(scenario).__name__) if use_cache else None
+                  for scenario in self.scenarios]
+        
+        futures = {}
+        pending = [index for index, result in enumerate(cached) if result is None]
+        if parallel and pending:
+            # Processes, όχι threads: τα scenarios είναι CPU-bound Python code (GIL)
+            workers = min(len(pending), max(1, (os.cpu_count() or 1) - 2))
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = {index: pool.submit(_run_scenario, type(self.scenarios[index])) for index in pending}
+        
+        for index, scenario in enumerate(self.scenarios):
             print(f"\n🔄 Running: {scenario.name}")
             print(f"   Description: {scenario.description}")
             
-            result = scenario.run()
+            if cached[index] is not None:
+                print("   ♻️  Cached result from a previous run in this process")
+                result = copy.deepcopy(cached[index])
+                result.duration = 0.0  # Δεν εκτελέστηκε τώρα: όχι παλιό timing ως νέο
+            elif parallel:
+                # Αναφορά με τη σειρά των scenarios, ώστε το output να μη μπερδεύεται
+                result, output = futures[index].result()
+                sys.stdout.write(output)
+            else:
+                result = scenario.run()
+            
+            if use_cache and cached[index] is None:
+                _SCENARIO_RESULTS[type(scenario).__name__] = copy.deepcopy(result)
             self.results.append(result)
             
             # Display immediate results
             status = "✅ PASSED" if result.success else "❌ FAILED"
-            print(f"   Status: {status} ({result.duration:.2f}s)")
+            timing = "cached" if cached[index] is not None else f"{result.duration:.2f}s"
+            print(f"   Status: {status} ({timing})")
             
             if result.issues:
                 print(f"   Issues: {len(result.issues)}")
@@ -801,83 +958,87 @@ class RealWorldTestSuite:
         
         self.generate_comprehensive_report()
     
-    def generate_comprehensive_report(self):
-        """Generate comprehensive real-world assessment report"""
-        print(f"\n" + "="*60)
-        print("📊 REAL-WORLD READINESS ASSESSMENT")
-        print("="*60)
+    def _build_summary(self):
+        """
+        Aggregates όλων των results σε ένα pass
+        
+        Returns:
+            tuple: (summary dict για report/export, all issues, all recommendations)
+        """
+        passed_scenarios = 0
+        total_duration = 0
+        all_issues = []
+        all_recommendations = []
+        
+        for result in self.results:
+            if result.success:
+                passed_scenarios += 1
+            total_duration += result.duration
+            all_issues.extend(result.issues)
+            all_recommendations.extend(result.recommendations)
         
-        # Overall statistics
         total_scenarios = len(self.results)
-        passed_scenarios = sum(1 for r in self.results if r.success)
-        overall_success_rate = (passed_scenarios / total_scenarios * 100) if total_scenarios > 0 else 0
+        summary = {
+            'total_scenarios': total_scenarios,
+            'passed_scenarios': passed_scenarios,
+            'total_duration': total_duration,
+            'overall_success_rate': (passed_scenarios / total_scenarios * 100) if total_scenarios > 0 else 0
+        }
+        return summary, all_issues, all_recommendations
+    
+    def generate_comprehensive_report(self):
+        """Generate comprehensive real-world assessment report (buffered, βλ. _emit)"""
+        self._emit(f"\n" + "="*60)
+        self._emit("📊 REAL-WORLD READINESS ASSESSMENT")
+        self._emit("="*60)
         
-        print(f"\nOverall Performance:")
-        print(f"  Scenarios Passed: {passed_scenarios}/{total_scenarios} ({overall_success_rate:.1f}%)")
-        print(f"  Total Execution Time: {sum(r.duration for r in self.results):.2f}s")
+        # Overall statistics (ένα pass, ξαναχρησιμοποιείται από τον exporter)
+        self._summary, all_issues, all_recommendations = self._build_summary()
+        total_scenarios = self._summary['total_scenarios']
+        passed_scenarios = self._summary['passed_scenarios']
+        overall_success_rate = self._summary['overall_success_rate']
+        
+        self._emit(f"\nOverall Performance:")
+        self._emit(f"  Scenarios Passed: {passed_scenarios}/{total_scenarios} ({overall_success_rate:.1f}%)")
+        self._emit(f"  Total Execution Time: {self._summary['total_duration']:.2f}s")
         
         # Use case assessment
-        print(f"\n📋 Use Case Readiness:")
+        self._emit(f"\n📋 Use Case Readiness:")
         
         for result in self.results:
             status_icon = "🟢" if result.success else "🔴"
-            print(f"  {status_icon} {result.name}")
-            
-            if result.metrics:
-                # Show key metrics
-                if 'execution_cycles' in result.metrics:
-                    print(f"      Execution: {result.metrics['execution_cycles']} cycles")
-                if 'average_cpi' in result.metrics:
-                    print(f"      Performance: {result.metrics['average_cpi']:.2f} CPI")
-                if 'production_score' in result.metrics:
-                    score = result.metrics['production_score']
-                    print(f"      Production Score: {score:.2f}/1.0")
+            self._emit(f"  {status_icon} {result.name}")
+            
+            # Show key metrics
+            metrics = result.metrics
+            self._out.extend(row.format(metrics[key]) for key, row in _METRIC_ROWS if key in metrics)
         
         # Critical issues summary
-        all_issues = []
-        for result in self.results:
-            all_issues.extend(result.issues)
-        
         if all_issues:
-            print(f"\n⚠️  Critical Issues ({len(all_issues)} total):")
-            # Group similar issues
-            issue_counts = {}
-            for issue in all_issues:
-                key_words = issue.split()[:3]  # First 3 words as key
-                key = " ".join(key_words)
-                issue_counts[key] = issue_counts.get(key, 0) + 1
+            self._emit(f"\n⚠️  Critical Issues ({len(all_issues)} total):")
+            # Group similar issues (first 3 words as key, maxsplit ώστε να μη σπάει όλο το string)
+            issue_counts = Counter(" ".join(issue.split(None, 3)[:3]) for issue in all_issues)
             
-            for issue_type, count in sorted(issue_counts.items(), key=lambda x: x[1], reverse=True)[:5]:
-                print(f"    - {issue_type}... ({count} occurrences)")
+            for issue_type, count in issue_counts.most_common(5):
+                self._emit(f"    - {issue_type}... ({count} occurrences)")
         
         # Recommendations summary
-        all_recommendations = []
-        for result in self.results:
-            all_recommendations.extend(result.recommendations)
-        
         if all_recommendations:
-            print(f"\n💡 Key Recommendations:")
+            self._emit(f"\n💡 Key Recommendations:")
             for i, rec in enumerate(all_recommendations[:5]):
-                print(f"    {i+1}. {rec}")
+                self._emit(f"    {i+1}. {rec}")
         
         # Deployment readiness
-        print(f"\n🚀 DEPLOYMENT READINESS ASSESSMENT:")
-        
-        if overall_success_rate >= 90:
-            readiness = "🟢 PRODUCTION READY"
-            deployment_rec = "System is ready for production deployment across all tested use cases"
-        elif overall_success_rate >= 75:
-            readiness = "🟡 MOSTLY READY"
-            deployment_rec = "System is suitable for most use cases with minor limitations"
-        elif overall_success_rate >= 50:
-            readiness = "🟠 DEVELOPMENT READY"
-            deployment_rec = "System is good for development and testing, needs work for production"
-        else:
-            readiness = "🔴 NOT READY"
-            deployment_rec = "System needs significant improvements before any deployment"
+        self._emit(f"\n🚀 DEPLOYMENT READINESS ASSESSMENT:")
         
-        print(f"  Status: {readiness}")
-        print(f"  Recommendation: {deployment_rec}")
+        readiness, deployment_rec = next((label, rec) for threshold, label, rec in _READINESS_TIERS
+                                         if overall_success_rate >= threshold)
+        
+        self._emit(f"  Status: {readiness}")
+        self._emit(f"  Recommendation: {deployment_rec}")
+        
+        # Ένα write για όλο το report πριν το export (που τυπώνει το δικό του μήνυμα)
+        self._flush_output()
         
         # Export detailed report
         self.export_detailed_report()
@@ -886,40 +1047,37 @@ class RealWorldTestSuite:
         
         return overall_success_rate >= 75
     
+    def _emit(self, line: str = ""):
+        """Προσθέτει μια γραμμή στο buffered report output"""
+        self._out.append(line)
+    
+    def _flush_output(self):
+        """Γράφει όλο το buffered report output με ένα sys.stdout.write"""
+        if self._out:
+            sys.stdout.write("\n".join(self._out) + "\n")
+            self._out.clear()
+    
     def export_detailed_report(self):
         """Export detailed JSON report"""
         try:
-            import json
-            import datetime
-            
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            # time.strftime: local time χωρίς ενδιάμεσο datetime object
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
             filename = f"risc_v_real_world_assessment_{timestamp}.json"
             
-            report_data = {
+            # Summary από το generate_comprehensive_report (ή τώρα, αν καλείται μόνο του)
+            summary = self._summary if self._summary is not None else self._build_summary()[0]
+            
+            envelope = {
                 'timestamp': timestamp,
                 'test_suite': 'Real-World Scenarios',
-                'summary': {
-                    'total_scenarios': len(self.results),
-                    'passed_scenarios': sum(1 for r in self.results if r.success),
-                    'total_duration': sum(r.duration for r in self.results),
-                    'overall_success_rate': (sum(1 for r in self.results if r.success) / len(self.results) * 100) if self.results else 0
-                },
-                'scenarios': []
+                'summary': summary
             }
+            # Shallow dict ανά result από τα slots (το asdict θα έκανε deep copy τα metrics)
+            scenarios = ({field: getattr(result, field) for field in _RESULT_FIELDS}
+                         for result in self.results)
             
-            for result in self.results:
-                scenario_data = {
-                    'name': result.name,
-                    'success': result.success,
-                    'duration': result.duration,
-                    'metrics': result.metrics,
-                    'issues': result.issues,
-                    'recommendations': result.recommendations
-                }
-                report_data['scenarios'].append(scenario_data)
-            
-            with open(filename, 'w') as f:
-                json.dump(report_data, f, indent=2)
+            with open(filename, 'wb') as f:
+                _write_report_stream(f, envelope, scenarios)
             
             print(f"\n📄 Detailed report exported: {filename}")
             
@@ -931,9 +1089,11 @@ def main():
     """Main function"""
     print("🚀 Starting Real-World RISC-V Testing Scenarios...")
     
+    parallel = '--parallel' in sys.argv[1:]
+    
     try:
         test_suite = RealWorldTestSuite()
-        success = test_suite.run_all_scenarios()
+        success = test_suite.run_all_scenarios(parallel=parallel)
         
         if success:
             print("\n🎉 Real-world testing PASSED! System is ready for deployment!")
@@ -944,7 +1104,6 @@ def main():
         
     except Exception as e:
         print(f"\n❌ Critical error in real-world testing: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
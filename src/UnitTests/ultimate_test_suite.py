@@ -220,6 +220,11 @@ class MasterTestRunner:
         result = self.test_exception_workflow()
         self.test_categories['workflow_tests'].append(result)
         self.add_result(result)
+        
+        # Test streamed JSON report export
+        result = self.test_report_export_workflow()
+        self.test_categories['workflow_tests'].append(result)
+        self.add_result(result)
     
     def run_python_test(self, test_name, test_file):
         """Run a Python test file"""
@@ -781,6 +786,54 @@ class MasterTestRunner:
             duration = time.time() - start_time
             return TestResult("Exception Workflow", False, duration, str(e), e)
     
+    def test_report_export_workflow(self):
+        """Test ότι το streamed report export δίνει το ίδιο JSON με ένα πλήρες dump"""
+        start_time = time.time()
+        
+        try:
+            import io
+            from contextlib import redirect_stdout
+            with redirect_stdout(io.StringIO()):  # Το import κάνει pre-assemble τα scenario programs
+                import real_world_scenarios
+            
+            envelope = {
+                'timestamp': '20250101_120000',
+                'test_suite': 'Real-World Scenarios',
+                'summary': {'total_scenarios': 2, 'passed_scenarios': 1, 'overall_success_rate': 50.0}
+            }
+            scenarios = [
+                {'name': 'Lab', 'success': True, 'duration': 0.25,
+                 'metrics': {'memory_state': {4096: 21}, 'cycles': [7, 9]},
+                 'issues': [], 'recommendations': ['Line one\nline two']},
+                {'name': 'Stress', 'success': False, 'duration': 1.5,
+                 'metrics': {}, 'issues': ['Low completion rate'], 'recommendations': []}
+            ]
+            
+            # Με και χωρίς envelope πεδία, για 2, 1 και 0 scenarios
+            cases = 0
+            for head in (envelope, {}):
+                for items in (scenarios, scenarios[:1], []):
+                    buffer = io.BytesIO()
+                    real_world_scenarios._write_report_stream(buffer, head, iter(items))
+                    streamed = buffer.getvalue()
+                    expected = real_world_scenarios._json_dumps_report({**head, 'scenarios': items})
+                    
+                    if json.loads(streamed) != json.loads(expected):
+                        raise AssertionError(f"Streamed report does not parse to the full report "
+                                             f"({len(head)} envelope fields, {len(items)} scenarios)")
+                    if streamed != expected:
+                        raise AssertionError(f"Streamed report bytes differ from the full dump "
+                                             f"({len(head)} envelope fields, {len(items)} scenarios)")
+                    cases += 1
+            
+            duration = time.time() - start_time
+            details = f"Streamed report matches full dump in {cases} cases"
+            return TestResult("Report Export Workflow", True, duration, details)
+        
+        except Exception as e:
+            duration = time.time() - start_time
+            return TestResult("Report Export Workflow", False, duration, str(e), e)
+    
     def add_result(self, result):
         """Add test result"""
         self.results.append(result)